@@ -1,54 +1,147 @@
 """The WoW Blizzard API integration."""
 import asyncio
 import logging
+from functools import partial
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN, CONF_CLIENT_ID, CONF_CLIENT_SECRET, CONF_REGION
-from .api_client import WoWBlizzardAPIClient
+from .const import (
+    DOMAIN,
+    CONF_CLIENT_ID,
+    CONF_CLIENT_SECRET,
+    CONF_REGION,
+    SETUP_TIMEOUT,
+    TOKEN_STORE_VERSION,
+)
+from .api_client import WoWBlizzardAPIClient, token_cache_key
+
+try:
+    from asyncio import timeout as asyncio_timeout
+except ImportError:  # Python < 3.11
+    from async_timeout import timeout as asyncio_timeout
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
 
+def get_shared_client(
+    hass: HomeAssistant, region: str, client_id: str, client_secret: str, owner: str
+) -> WoWBlizzardAPIClient:
+    """Return the long-lived API client for these credentials, creating it if needed.
+
+    Clients are keyed by the credential hash, so a different secret gets its
+    own client instead of replacing one a running entry still uses. owner (an
+    entry or flow id) holds the client until it calls release_shared_client.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    clients = domain_data.setdefault("_clients", {})
+    owners = domain_data.setdefault("_client_owners", {})
+    # Also names the persisted token store, so a token is only ever loaded for
+    # the credentials that fetched it and no credential ends up in a file name
+    key = token_cache_key(client_id, client_secret, region)
+    client = clients.get(key)
+
+    if client is None:
+        store = Store(hass, TOKEN_STORE_VERSION, f"{DOMAIN}.token.{key}")
+        client = WoWBlizzardAPIClient(
+            client_id,
+            client_secret,
+            region,
+            session=async_get_clientsession(hass),
+            token_store=store,
+        )
+        clients[key] = client
+
+    owners.setdefault(key, set()).add(owner)
+    return client
+
+
+@callback
+def release_shared_client(
+    hass: HomeAssistant, region: str, client_id: str, client_secret: str, owner: str
+) -> None:
+    """Drop owner's hold on a shared client, closing it once nobody holds it."""
+    domain_data = hass.data.get(DOMAIN, {})
+    key = token_cache_key(client_id, client_secret, region)
+    holders = domain_data.get("_client_owners", {}).get(key)
+    if holders is None:
+        return
+    holders.discard(owner)
+    if holders:
+        return
+    del domain_data["_client_owners"][key]
+    client = domain_data.get("_clients", {}).pop(key, None)
+    if client is not None:
+        hass.async_create_task(client.close())
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up WoW Blizzard API from a config entry."""
     hass.data.setdefault(DOMAIN, {})
-    
-    # Test the API connection before setting up platforms
-    client = WoWBlizzardAPIClient(
+
+    # Entries created by older versions persisted the whole realm list
+    if "available_realms" in entry.data:
+        hass.config_entries.async_update_entry(
+            entry,
+            data={k: v for k, v in entry.data.items() if k != "available_realms"},
+        )
+
+    client = get_shared_client(
+        hass,
+        entry.data[CONF_REGION],
         entry.data[CONF_CLIENT_ID],
-        entry.data[CONF_CLIENT_SECRET], 
-        entry.data[CONF_REGION]
+        entry.data[CONF_CLIENT_SECRET],
+        entry.entry_id,
     )
-    
-    try:
-        # Test connection
-        test_data = await client.get_all_realms()
-        if not test_data:
-            raise ConfigEntryNotReady("Unable to connect to Blizzard API")
-    except Exception as err:
-        _LOGGER.error("Failed to connect to Blizzard API: %s", err)
-        raise ConfigEntryNotReady(f"Unable to connect to Blizzard API: {err}")
-    finally:
-        await client.close()
+    entry.async_on_unload(
+        partial(
+            release_shared_client,
+            hass,
+            entry.data[CONF_REGION],
+            entry.data[CONF_CLIENT_ID],
+            entry.data[CONF_CLIENT_SECRET],
+            entry.entry_id,
+        )
+    )
+
+    # Set up options update listener before anything network-bound so it is
+    # always disposed of through async_on_unload
+    entry.async_on_unload(entry.add_update_listener(update_listener))
+
+    # Home Assistant expects ConfigEntryNotReady before any platform is
+    # forwarded; the token is usually cached, so this rarely costs a request
+    await _async_probe_connection(client)
 
     # Store the config entry data for access by platforms
     hass.data[DOMAIN][entry.entry_id] = entry.data
 
-    # Forward the setup to the sensor platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Set up options update listener
-    entry.async_on_unload(entry.add_update_listener(update_listener))
-
     return True
 
 
+async def _async_probe_connection(client: WoWBlizzardAPIClient) -> None:
+    """Check that the credentials still get a token.
+
+    The realm list was already validated in the config flow and the first
+    coordinator refresh surfaces any data problems.
+    """
+    try:
+        async with asyncio_timeout(SETUP_TIMEOUT):
+            await client.ensure_token()
+    except asyncio.TimeoutError as err:
+        raise ConfigEntryNotReady("Timed out connecting to Blizzard API") from err
+    except Exception as err:
+        _LOGGER.error("Failed to connect to Blizzard API: %s", err)
+        raise ConfigEntryNotReady(f"Unable to connect to Blizzard API: {err}")
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
@@ -59,4 +152,4 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update listener for options changes."""
-    await hass.config_entries.async_reload(entry.entry_id)
\ No newline at end of file
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -3,20 +3,200 @@ import asyncio
 import aiohttp
 import logging
 import base64
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+import hashlib
+import random
+import re
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping, Tuple
 
-from .const import API_URLS, TOKEN_URLS
+from .const import (
+    API_URLS,
+    TOKEN_URLS,
+    API_CONCURRENCY_LIMIT,
+    API_CONNECTIONS_PER_HOST,
+    API_RATE_LIMIT_PER_SECOND,
+    API_RATE_LIMIT_PER_HOUR,
+    API_RATE_LIMIT_HEADROOM,
+    API_MAX_RETRIES,
+    API_BACKOFF_BASE,
+    API_BACKOFF_CAP,
+    API_BACKOFF_JITTER,
+    AUTH_ERROR_CODES,
+    RETRYABLE_STATUS_CODES,
+    TOKEN_REFRESH_MARGIN,
+    TOKEN_BACKGROUND_REFRESH_LEAD,
+    STATIC_DATA_CACHE_TTL,
+    REALM_DATA_CACHE_TTL,
+    PROFILE_CACHE_TTL,
+    PVP_BRACKETS,
+    CACHE_STALE_FACTOR,
+    SEASON_ID_CACHE_TTL,
+    CIRCUIT_BREAKER_THRESHOLD,
+    CIRCUIT_BREAKER_COOLDOWN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Access tokens shared by every client for the same credentials, keyed by a
+# hash so the key does not hold credential material: key -> (token, deadline)
+_TOKEN_CACHE: Dict[str, Tuple[str, float]] = {}
+_TOKEN_LOCKS: Dict[str, asyncio.Lock] = {}
+
+# OAuth 2.0 Client Credentials Grant (2025 Standard)
+_TOKEN_REQUEST_DATA = {
+    "grant_type": "client_credentials",
+    "scope": "wow.profile",  # Required scope for character data
+}
+
+try:  # Parse bytes directly with orjson; Home Assistant ships it
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:  # aiohttp can only decode brotli bodies when a binding is installed
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+_DEFAULT_HEADERS = {
+    "User-Agent": "HomeAssistant-WoW-Integration/2025.8",
+    "Accept-Encoding": _ACCEPT_ENCODING,
+}
+
+
+# Character documents that only change when the player logs in and plays
+_SLOW_CHARACTER_DOCUMENTS = frozenset({"equipment", "achievements"})
+
+
+def token_cache_key(client_id: str, client_secret: str, region: str) -> str:
+    """Return the shared token cache key for a set of credentials and region.
+
+    The secret is part of the key so a client with a wrong secret never gets
+    the token fetched with the right one; hashing keeps it out of the key.
+    """
+    return hashlib.sha256(f"{client_id}:{client_secret}:{region}".encode()).hexdigest()
+
+
+def _status_error(
+    status: int, endpoint: str, text: str, retry_after: Optional[str]
+) -> "WoWAPIError":
+    """Build the typed error for an unsuccessful response status."""
+    if status in AUTH_ERROR_CODES:
+        return WoWAuthError(f"Access denied: {endpoint} - Check API permissions", status)
+    if status == 429:
+        return WoWRateLimited(f"Rate limited: {endpoint}", status, retry_after)
+    return WoWAPIError(f"API Error {status}: {text}", status, retry_after)
+
+
+class TokenBucket:
+    """Async token bucket admitting calls at a steady rate with bursts up to capacity."""
+
+    def __init__(self, rate: float, capacity: float):
+        """Initialize the bucket full."""
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    self._tokens = min(
+                        self._capacity, self._tokens + (now - self._updated) * self._rate
+                    )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+def _character_endpoint(suffix: str, doc: str):
+    """Build a getter for a plain profile-namespace character resource.
+
+    The only per-call work left is joining the cached character path with
+    the fixed suffix.
+    """
+
+    async def getter(
+        self, realm: str, character_name: str, raise_for_status: bool = False
+    ) -> Dict[str, Any]:
+        return await self._make_request(
+            self._character_base(realm, character_name) + suffix,
+            self._profile_params,
+            raise_for_status,
+        )
+
+    getter.__doc__ = doc
+    return getter
+
 
 class WoWBlizzardAPIClient:
+    """API client"""
+
+    __slots__ = (
+        "client_id",
+        "client_secret",
+        "region",
+        "api_url",
+        "token_url",
+        "locale",
+        "_profile_params",
+        "_dynamic_params",
+        "_token_headers",
+        "_api_headers",
+        "_session",
+        "_owns_session",
+        "_timeout",
+        "_access_token",
+        "_token_expires",
+        "_token_key",
+        "_token_lock",
+        "_refresh_handle",
+        "_refresh_task",
+        "_token_store",
+        "_store_loaded",
+        "_connected_realm_ids",
+        "_cache",
+        "_inflight",
+        "_season_ids",
+        "_throttle_until",
+        "_circuit",
+        "_limit_per_host",
+        "_request_semaphore",
+        "_bucket",
+        "_hour_bucket",
+    )
+
+    _SLUG_TABLE = str.maketrans({"'": None, " ": "-", "ä": "a", "ö": "o", "ü": "u", "ß": "ss"})
+
     @staticmethod
+    @lru_cache(maxsize=256)
     def realm_to_slug(realm: str) -> str:
         """Convert realm name to slug for Blizzard API."""
-        return realm.strip().lower().replace("'", "").replace(" ", "-").replace("ä", "a").replace("ö", "o").replace("ü", "u").replace("ß", "ss")
-    """API client"""
+        return realm.strip().lower().translate(WoWBlizzardAPIClient._SLUG_TABLE)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _character_base(realm: str, character_name: str) -> str:
+        """Return the profile path for a character, built once per character."""
+        return (
+            f"/profile/wow/character/{WoWBlizzardAPIClient.realm_to_slug(realm)}"
+            f"/{character_name.lower()}"
+        )
 
     REGION_LOCALES = {
         "us": "en_US",
@@ -33,6 +213,9 @@ class WoWBlizzardAPIClient:
         region: str = "us",
         locale: Optional[str] = None,
         session: Optional[aiohttp.ClientSession] = None,
+        concurrency_limit: int = API_CONCURRENCY_LIMIT,
+        limit_per_host: int = API_CONNECTIONS_PER_HOST,
+        token_store: Optional[Any] = None,
     ):
         """Initialize the API client."""
         self.client_id = client_id
@@ -42,112 +225,517 @@ class WoWBlizzardAPIClient:
         self.token_url = TOKEN_URLS.get(self.region)
         
         self.locale = locale or self.REGION_LOCALES.get(self.region, "en_US")
+        # Read-only query params shared by every request in each namespace
+        self._profile_params = MappingProxyType(
+            {"namespace": f"profile-{self.region}", "locale": self.locale}
+        )
+        self._dynamic_params = MappingProxyType(
+            {"namespace": f"dynamic-{self.region}", "locale": self.locale}
+        )
         
+        # Credentials never change for a client, so the headers are built once
+        credentials = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
+        self._token_headers = {
+            "Authorization": f"Basic {credentials}",
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+
+        # A session handed in (normally Home Assistant's shared one) is not ours to close
         self._session = session
+        self._owns_session = session is None
+        # Our own session carries the default headers itself, a borrowed one
+        # needs them on every request
+        self._api_headers = {} if self._owns_session else dict(_DEFAULT_HEADERS)
+        self._timeout = aiohttp.ClientTimeout(total=30)
         self._access_token = None
-        self._token_expires = None
-        self._request_count = 0
-        self._last_request_reset = datetime.now()
+        # Monotonic deadline, immune to wall-clock jumps
+        self._token_expires = 0.0
+        self._token_key = token_cache_key(client_id, client_secret, self.region)
+        self._token_lock = _TOKEN_LOCKS.setdefault(self._token_key, asyncio.Lock())
+        self._refresh_handle: Optional[asyncio.TimerHandle] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        # Any object with async_load/async_save, e.g. a Home Assistant Store
+        self._token_store = token_store
+        self._store_loaded = False
+        # Realm slug -> connected realm id, which practically never changes
+        self._connected_realm_ids: Dict[str, int] = {}
+        # (endpoint, params) -> fetched time, validators and body of the last
+        # response, served directly within its TTL and revalidated after
+        self._cache: Dict[tuple, Dict[str, Any]] = {}
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        # (realm, character) -> (current M+ season id, derived at)
+        self._season_ids: Dict[Tuple[str, str], Tuple[int, float]] = {}
+        # Monotonic time before which requests hold back (X-Ratelimit headers)
+        self._throttle_until = 0.0
+        # endpoint -> (consecutive failures, skipped until) for the circuit breaker
+        self._circuit: Dict[str, Tuple[int, float]] = {}
+        self._limit_per_host = limit_per_host
+        self._request_semaphore = asyncio.Semaphore(concurrency_limit)
+        # Blizzard allows 100 requests/second and 36,000/hour per client; run a
+        # little below that so clock skew and bursts do not tip us into 429s
+        per_second = API_RATE_LIMIT_PER_SECOND * API_RATE_LIMIT_HEADROOM
+        per_hour = API_RATE_LIMIT_PER_HOUR * API_RATE_LIMIT_HEADROOM
+        self._bucket = TokenBucket(per_second, per_second)
+        self._hour_bucket = TokenBucket(per_hour / 3600, per_hour)
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None:
-            timeout = aiohttp.ClientTimeout(total=30)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+        """Get the session reused for every request, creating our own if none was given."""
+        if self._owns_session and (self._session is None or self._session.closed):
+            # Keep connections and DNS lookups alive between polls so repeated
+            # calls to the same Blizzard host skip the TCP/TLS handshake.
+            connector = aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=self._limit_per_host,
+                ttl_dns_cache=600,
+                keepalive_timeout=75,
+            )
+            self._session = aiohttp.ClientSession(
+                timeout=self._timeout, connector=connector, headers=_DEFAULT_HEADERS
+            )
         return self._session
 
+    def _token_valid(self) -> bool:
+        """Return True while the cached access token can still be used."""
+        return bool(self._access_token) and time.monotonic() < self._token_expires
+
+    async def _load_store(self) -> None:
+        """Restore the token and realm ids persisted by a previous run."""
+        self._store_loaded = True
+        if self._token_store is None:
+            return
+
+        stored = await self._token_store.async_load()
+        if not stored:
+            return
+        self._connected_realm_ids.update(stored.get("connected_realms", {}))
+        try:
+            expires = datetime.fromisoformat(stored["expires"])
+            token = stored["token"]
+        except (KeyError, TypeError, ValueError):
+            return
+        # The store keeps wall-clock time; convert what is left to monotonic
+        self._access_token = token
+        self._token_expires = time.monotonic() + (expires.timestamp() - time.time())
+        # Serve other clients for the same credentials from memory too
+        if self._token_valid():
+            _TOKEN_CACHE.setdefault(self._token_key, (token, self._token_expires))
+            self._schedule_refresh()
+
+    async def _ensure_store_loaded(self) -> None:
+        """Load persisted state once, for callers outside the token refresh."""
+        if not self._store_loaded:
+            async with self._token_lock:
+                if not self._store_loaded:
+                    await self._load_store()
+
+    async def _save_store(self) -> None:
+        """Persist the current token and known connected realm ids."""
+        if self._token_store is None:
+            return
+        data: Dict[str, Any] = {"connected_realms": dict(self._connected_realm_ids)}
+        if self._access_token:
+            remaining = self._token_expires - time.monotonic()
+            data["token"] = self._access_token
+            data["expires"] = datetime.fromtimestamp(time.time() + remaining).isoformat()
+        await self._token_store.async_save(data)
+
     async def _get_access_token(self) -> str:
         """Get access token using OAuth 2.0 (August 2025 version)."""
-        if (
-            self._access_token
-            and self._token_expires
-            and datetime.now() < self._token_expires
-        ):
+        if self._token_valid():
             return self._access_token
 
+        # Only one refresh at a time; concurrent callers reuse its result
+        async with self._token_lock:
+            if not self._store_loaded:
+                await self._load_store()
+            if self._token_valid():
+                return self._access_token
+            # Another client instance for the same credentials may hold one
+            shared = _TOKEN_CACHE.get(self._token_key)
+            if shared and time.monotonic() < shared[1]:
+                self._access_token, self._token_expires = shared
+                self._schedule_refresh()
+                return self._access_token
+            return await self._fetch_access_token()
+
+    def _schedule_refresh(self) -> None:
+        """Plan a background refresh shortly before the current token lapses.
+
+        Requests then only wait for the OAuth round trip on a cold start.
+        """
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+        delay = max(self._token_expires - time.monotonic() - TOKEN_BACKGROUND_REFRESH_LEAD, 0)
+        self._refresh_handle = asyncio.get_running_loop().call_later(
+            delay, self._start_background_refresh
+        )
+
+    def _start_background_refresh(self) -> None:
+        """Timer callback starting the background refresh task."""
+        self._refresh_handle = None
+        self._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        """Replace the token before it expires, outside any request."""
+        async with self._token_lock:
+            # Another client for the same credentials may have refreshed already
+            shared = _TOKEN_CACHE.get(self._token_key)
+            if shared and shared[1] > self._token_expires:
+                self._access_token, self._token_expires = shared
+                self._schedule_refresh()
+                return
+            try:
+                await self._fetch_access_token()
+            except Exception:
+                # Already logged; the next request refreshes on demand
+                pass
+
+    def _invalidate_token(self, rejected: str) -> None:
+        """Forget a token the API rejected, unless it was already replaced."""
+        if self._access_token == rejected:
+            self._access_token = None
+            self._token_expires = 0.0
+        if _TOKEN_CACHE.get(self._token_key, (None,))[0] == rejected:
+            del _TOKEN_CACHE[self._token_key]
+
+    async def _fetch_access_token(self) -> str:
+        """Request a new access token and persist it."""
         session = await self._get_session()
-        
-        # OAuth 2.0 Client Credentials Grant (2025 Standard)
-        credentials = base64.b64encode(f"{self.client_id}:{self.client_secret}".encode()).decode()
-        
-        headers = {
-            "Authorization": f"Basic {credentials}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        
-        data = {
-            "grant_type": "client_credentials",
-            "scope": "wow.profile",  # Required scope for character data
-        }
 
         try:
-            async with session.post(self.token_url, data=data, headers=headers) as response:
+            async with session.post(
+                self.token_url, data=_TOKEN_REQUEST_DATA, headers=self._token_headers, timeout=self._timeout
+            ) as response:
                 if response.status == 200:
-                    token_data = await response.json()
+                    token_data = _json_loads(await response.read())
                     self._access_token = token_data["access_token"]
                     expires_in = token_data.get("expires_in", 3600)
-                    self._token_expires = datetime.now() + timedelta(seconds=expires_in - 60)
+                    self._token_expires = time.monotonic() + expires_in - TOKEN_REFRESH_MARGIN
                     _LOGGER.info("Successfully obtained access token")
-                    return self._access_token
                 else:
                     error_text = await response.text()
                     _LOGGER.error(f"Token request failed: {response.status} - {error_text}")
-                    raise Exception(f"Failed to get access token: {response.status}")
+                    error = WoWAuthError if response.status in (400, 401, 403) else WoWAPIError
+                    raise error("Failed to get access token", response.status)
         except Exception as e:
             _LOGGER.error(f"Error getting access token: {e}")
             raise
 
-    async def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Make authenticated API request."""
+        _TOKEN_CACHE[self._token_key] = (self._access_token, self._token_expires)
+        self._schedule_refresh()
+        await self._save_store()
+        return self._access_token
+
+    async def ensure_token(self) -> None:
+        """Make sure a valid access token is available, fetching one if needed."""
+        await self._get_access_token()
+
+    async def _make_request(
+        self,
+        endpoint: str,
+        params: Optional[Mapping[str, Any]] = None,
+        raise_for_status: bool = False,
+        cacheable: bool = True,
+    ) -> Dict[str, Any]:
+        """Make authenticated API request.
+
+        Cacheable responses are kept and served within their TTL, then
+        revalidated with If-None-Match/If-Modified-Since so an unchanged
+        resource costs an empty 304. Up to CACHE_STALE_FACTOR TTLs old the
+        stale body is returned at once and revalidated in the background.
+        Pass cacheable=False for a one-off call whose body is not worth keeping.
+
+        With raise_for_status, failures are raised as WoWAPIError subclasses
+        (WoWNotFound, WoWAuthError, WoWRateLimited) instead of being logged and
+        returned as an empty dict. Either way throttling and transient 5xx
+        responses are retried first, and only raised once API_MAX_RETRIES
+        are used up.
+
+        An endpoint that keeps failing is left alone for a while: after
+        CIRCUIT_BREAKER_THRESHOLD consecutive failures, calls short-circuit for
+        CIRCUIT_BREAKER_COOLDOWN seconds instead of spending request budget.
+        """
+        # Copy rather than add the locale in place: params may be shared
+        if params is None:
+            params = {"locale": self.locale}
+        elif "locale" not in params:
+            params = {**params, "locale": self.locale}
+
+        request_key = (endpoint, tuple(sorted(params.items())))
+        cache_key = request_key if cacheable else None
+        ttl = self._cache_ttl(endpoint, params) if cacheable else 0
+        cached = self._cache.get(cache_key) if cacheable else None
+        age = time.monotonic() - cached["fetched"] if cached else 0
+        if cached and ttl and age < ttl:
+            return cached["body"]
+
+        if self._circuit_open(endpoint):
+            if raise_for_status:
+                raise WoWAPIError(f"Backing off {endpoint} after repeated failures")
+            return cached["body"] if cached else {}
+
+        if cached and ttl and age < ttl * CACHE_STALE_FACTOR:
+            # Stale while revalidate: failures are only logged, the old body
+            # stays in place until a fresh one arrives
+            self._flight(endpoint, params, False, request_key, cache_key, cached, ttl)
+            return cached["body"]
+
+        task = self._flight(
+            endpoint, params, raise_for_status, request_key, cache_key, cached, ttl
+        )
+        # Shielded so one cancelled caller does not cancel the others' request
+        return await asyncio.shield(task)
+
+    def _flight(
+        self,
+        endpoint: str,
+        params: Mapping[str, Any],
+        raise_for_status: bool,
+        request_key: tuple,
+        cache_key: Optional[tuple],
+        cached: Optional[Dict[str, Any]],
+        ttl: float,
+    ) -> asyncio.Task:
+        """Return the shared task for a request, starting it if none is running.
+
+        Identical concurrent calls, e.g. several sensors updating on the same
+        tick, ride on one request. Strict and lenient callers handle errors
+        differently, so they do not share.
+        """
+        flight_key = (request_key, raise_for_status)
+        task = self._inflight.get(flight_key)
+        if task is None:
+            task = asyncio.create_task(
+                self._request_with_retry(
+                    endpoint, params, raise_for_status, cache_key, cached, ttl
+                )
+            )
+            self._inflight[flight_key] = task
+            task.add_done_callback(partial(self._flight_done, flight_key))
+        return task
+
+    def _flight_done(self, flight_key: tuple, task: asyncio.Task) -> None:
+        """Forget a finished shared request.
+
+        If every caller was cancelled nobody awaits the task any more, so its
+        exception is retrieved here rather than reported as never retrieved.
+        """
+        if self._inflight.get(flight_key) is task:
+            del self._inflight[flight_key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _request_with_retry(
+        self,
+        endpoint: str,
+        params: Mapping[str, Any],
+        raise_for_status: bool,
+        cache_key: Optional[tuple],
+        cached: Optional[Dict[str, Any]],
+        ttl: float,
+    ) -> Dict[str, Any]:
+        """Issue a GET with pacing and retries, updating the response cache.
+
+        Throttling, transient 5xx errors and a rejected token (once) all go
+        through the same bounded loop.
+        """
         access_token = await self._get_access_token()
         session = await self._get_session()
         
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "User-Agent": "HomeAssistant-WoW-Integration/2025.8",
-        }
+        headers = {**self._api_headers, "Authorization": f"Bearer {access_token}"}
+        # Revalidate what we already have; an unchanged resource comes back as
+        # an empty 304 and skips both the download and the parse
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
         
         url = f"{self.api_url}{endpoint}"
         
-        if params is None:
-            params = {}
-        if "locale" not in params:
-            params["locale"] = self.locale
-        
+        reauthenticated = False
+        failure: Optional[WoWAPIError] = None
+        for attempt in range(API_MAX_RETRIES + 1):
+            retry_delay = None
+            token_rejected = False
+            # Pace requests below Blizzard's quota rather than waiting for 429s
+            await self._bucket.acquire()
+            await self._hour_bucket.acquire()
+            if (pause := self._throttle_until - time.monotonic()) > 0:
+                await asyncio.sleep(pause)
+            try:
+                # Bound concurrency for the whole client instead of sleeping between calls
+                async with self._request_semaphore:
+                    async with session.get(
+                        url, headers=headers, params=params, timeout=self._timeout
+                    ) as response:
+                        self._note_rate_limit(response.headers)
+                        status = response.status
+                        if status == 200:
+                            data = _json_loads(await response.read())
+                            _LOGGER.debug(f"API Success: {endpoint}")
+                            if cache_key is not None:
+                                self._store_response(cache_key, response.headers, data, ttl)
+                            self._circuit.pop(endpoint, None)
+                            return data
+                        elif status == 304 and cached:
+                            _LOGGER.debug(f"API Not Modified: {endpoint}")
+                            cached["fetched"] = time.monotonic()
+                            self._circuit.pop(endpoint, None)
+                            return cached["body"]
+                        elif status == 404:
+                            # The API answered; the resource just does not exist
+                            _LOGGER.debug(f"Resource not found: {endpoint}")
+                            self._circuit.pop(endpoint, None)
+                            if raise_for_status:
+                                raise WoWNotFound(f"Resource not found: {endpoint}", status)
+                            return {}
+                        elif status == 401 and not reauthenticated:
+                            token_rejected = True
+                        elif (
+                            status in RETRYABLE_STATUS_CODES
+                            and attempt < API_MAX_RETRIES
+                        ):
+                            retry_delay = self._retry_delay(response.headers.get("Retry-After"), attempt)
+                        else:
+                            failure = _status_error(
+                                status, endpoint, await response.text(), response.headers.get("Retry-After")
+                            )
+            except WoWNotFound:
+                raise
+            except Exception as e:
+                failure = WoWAPIError(f"Request failed for {endpoint}: {e}")
+                failure.__cause__ = e
+
+            if failure is not None:
+                break
+
+            if token_rejected:
+                # Revoked or expired early: retry once straight away with a new token
+                reauthenticated = True
+                self._invalidate_token(access_token)
+                access_token = await self._get_access_token()
+                headers["Authorization"] = f"Bearer {access_token}"
+                continue
+
+            # Wait outside the semaphore so other requests are not held up
+            _LOGGER.warning(
+                "Transient error for %s, retrying in %.1f seconds", endpoint, retry_delay
+            )
+            await asyncio.sleep(retry_delay)
+
+        if failure is None:
+            failure = WoWAPIError(f"Giving up on {endpoint} after {API_MAX_RETRIES} retries")
+        self._record_failure(endpoint)
+        if raise_for_status:
+            raise failure
+        if isinstance(failure, WoWAuthError):
+            _LOGGER.warning(str(failure))
+        else:
+            _LOGGER.error(str(failure))
+        return {}
+
+    def _circuit_open(self, endpoint: str) -> bool:
+        """Return True while an endpoint is being skipped after repeated failures."""
+        state = self._circuit.get(endpoint)
+        return state is not None and time.monotonic() < state[1]
+
+    def _record_failure(self, endpoint: str) -> None:
+        """Count a failure, opening the endpoint's circuit once they pile up.
+
+        The count is kept through the cooldown, so a single failure of the
+        first call afterwards opens the circuit again.
+        """
+        failures, open_until = self._circuit.get(endpoint, (0, 0.0))
+        failures += 1
+        if failures >= CIRCUIT_BREAKER_THRESHOLD:
+            _LOGGER.warning(
+                "%s failed %s times in a row, pausing it for %s seconds",
+                endpoint, failures, CIRCUIT_BREAKER_COOLDOWN,
+            )
+            open_until = time.monotonic() + CIRCUIT_BREAKER_COOLDOWN
+        self._circuit[endpoint] = (failures, open_until)
+
+    def _store_response(
+        self, cache_key: tuple, headers: Any, data: Dict[str, Any], ttl: float
+    ) -> None:
+        """Keep a response that is cacheable or can be revalidated later."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if ttl or etag or last_modified:
+            self._cache[cache_key] = {
+                "fetched": time.monotonic(),
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": data,
+            }
+
+    @staticmethod
+    def _cache_ttl(endpoint: str, params: Mapping[str, Any]) -> float:
+        """Seconds a response may be served from cache, 0 for no caching.
+
+        Static game data changes with patches and realm details almost never.
+        A character's profile, gear and achievements move slowly enough for
+        a few minutes' lag, while PvP, raid and Mythic+ progress and the
+        connected-realm status must stay live (they are still revalidated).
+        """
+        namespace = params.get("namespace", "")
+        if namespace.startswith("static-"):
+            return STATIC_DATA_CACHE_TTL
+        if namespace.startswith("dynamic-") and endpoint.startswith("/data/wow/realm/"):
+            return REALM_DATA_CACHE_TTL
+        if endpoint.startswith("/profile/wow/character/"):
+            # /profile/wow/character/{realm}/{name}[/{document}...]
+            parts = endpoint.split("/", 7)
+            if len(parts) == 6 or parts[6] in _SLOW_CHARACTER_DOCUMENTS:
+                return PROFILE_CACHE_TTL
+        return 0
+
+    def _note_rate_limit(self, headers: Any) -> None:
+        """Slow down ahead of time when the server reports a nearly spent quota.
+
+        Once fewer than 10% of the window's requests remain, the rest are
+        spread evenly over the time left until the window resets.
+        """
         try:
-            async with session.get(url, headers=headers, params=params) as response:
-                self._request_count += 1
-                
-                if response.status == 200:
-                    data = await response.json()
-                    _LOGGER.debug(f"API Success: {endpoint}")
-                    return data
-                elif response.status == 404:
-                    _LOGGER.debug(f"Resource not found: {endpoint}")
-                    return {}
-                elif response.status == 403:
-                    _LOGGER.warning(f"Access denied: {endpoint} - Check API permissions")
-                    return {}
-                elif response.status == 429:
-                    _LOGGER.warning("Rate limited, waiting 60 seconds")
-                    await asyncio.sleep(60)
-                    return await self._make_request(endpoint, params)
-                else:
-                    error_text = await response.text()
-                    _LOGGER.error(f"API Error {response.status}: {error_text}")
-                    return {}
-        except Exception as e:
-            _LOGGER.error(f"Request failed for {endpoint}: {e}")
-            return {}
+            limit = int(headers["X-Ratelimit-Limit"])
+            remaining = int(headers["X-Ratelimit-Remaining"])
+            reset = float(headers.get("X-Ratelimit-Reset", 1))
+        except (KeyError, TypeError, ValueError):
+            return
+        if remaining >= limit * 0.1:
+            return
+        if reset > 1e9:  # Sent as an epoch timestamp rather than seconds left
+            reset -= time.time()
+        self._throttle_until = time.monotonic() + max(reset, 0) / max(remaining, 1)
+
+    @staticmethod
+    def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+        """Seconds to wait before retrying, preferring the server's Retry-After.
+
+        Retry-After may be given in seconds or as an HTTP date.
+        """
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            try:
+                delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                delay = 0
+        if delay <= 0:
+            delay = min(API_BACKOFF_CAP, API_BACKOFF_BASE * 2 ** attempt)
+        # Jitter keeps sensors that were throttled together from retrying together
+        return delay * (1 + random.uniform(0, API_BACKOFF_JITTER))
 
     # === Character Profile Methods ===
     
-    async def get_character_profile(self, realm: str, character_name: str) -> Dict[str, Any]:
+    async def get_character_profile(
+        self, realm: str, character_name: str, raise_for_status: bool = False
+    ) -> Dict[str, Any]:
         """Get character profile data."""
-        realm_slug = self.realm_to_slug(realm)
-        endpoint = f"/profile/wow/character/{realm_slug}/{character_name.lower()}"
-        params = {"namespace": f"profile-{self.region}"}
-        profile = await self._make_request(endpoint, params)
+        endpoint = self._character_base(realm, character_name)
+        params = self._profile_params
+        profile = await self._make_request(endpoint, params, raise_for_status)
         
         if profile:
             _LOGGER.info(f"Got profile for {character_name}-{realm}: Level {profile.get('level', 'Unknown')}")
@@ -156,19 +744,19 @@ class WoWBlizzardAPIClient:
             
         return profile
 
-    async def get_character_equipment(self, realm: str, character_name: str) -> Dict[str, Any]:
-        """Get character equipment data."""
-        realm_slug = self.realm_to_slug(realm)
-        endpoint = f"/profile/wow/character/{realm_slug}/{character_name.lower()}/equipment"
-        params = {"namespace": f"profile-{self.region}"}
-        return await self._make_request(endpoint, params)
+    get_character_equipment = _character_endpoint("/equipment", "Get character equipment data.")
 
-    async def get_character_achievements(self, realm: str, character_name: str) -> Dict[str, Any]:
-        """Get character achievements data."""
-        realm_slug = self.realm_to_slug(realm)
-        endpoint = f"/profile/wow/character/{realm_slug}/{character_name.lower()}/achievements"
-        params = {"namespace": f"profile-{self.region}"}
-        return await self._make_request(endpoint, params)
+    @staticmethod
+    def calculate_item_level(equipment_data: Dict[str, Any]) -> float:
+        """Average item level of the equipped items in an equipment response."""
+        levels = [
+            item["level"]["value"]
+            for item in equipment_data.get("equipped_items", ())
+            if "level" in item and item.get("slot", {}).get("type") not in ("SHIRT", "TABARD")
+        ]
+        return round(sum(levels) / len(levels), 1) if levels else 0
+
+    get_character_achievements = _character_endpoint("/achievements", "Get character achievements data.")
 
     async def get_character_statistics(self, realm: str, character_name: str) -> Dict[str, Any]:
         """Get character statistics (DEPRECATED - kept for compatibility)."""
@@ -178,96 +766,201 @@ class WoWBlizzardAPIClient:
 
     # === Realm/Server Methods ===
     
-    async def get_realm_info(self, realm: str) -> Dict[str, Any]:
+    async def get_realm_info(self, realm: str, raise_for_status: bool = False) -> Dict[str, Any]:
         """Get realm information."""
         realm_slug = self.realm_to_slug(realm)
         endpoint = f"/data/wow/realm/{realm_slug}"
-        params = {"namespace": f"dynamic-{self.region}"}
-        return await self._make_request(endpoint, params)
+        params = self._dynamic_params
+        return await self._make_request(endpoint, params, raise_for_status)
 
-    async def get_all_realms(self) -> Dict[str, Any]:
+    async def get_all_realms(self, raise_for_status: bool = False) -> Dict[str, Any]:
         """Get all realms in region."""
         endpoint = "/data/wow/realm/index"
-        params = {"namespace": f"dynamic-{self.region}"}
-        return await self._make_request(endpoint, params)
+        params = self._dynamic_params
+        return await self._make_request(endpoint, params, raise_for_status)
 
-    async def get_connected_realm(self, realm: str) -> Dict[str, Any]:
+    async def get_connected_realm(self, realm: str, raise_for_status: bool = False) -> Dict[str, Any]:
         """Get connected realm info (for server status)."""
         realm_slug = self.realm_to_slug(realm)
-        realm_info = await self.get_realm_info(realm_slug)
-        if not realm_info or "id" not in realm_info:
-            return {}
-        
-        endpoint = f"/data/wow/connected-realm/{realm_info['id']}"
-        params = {"namespace": f"dynamic-{self.region}"}
-        return await self._make_request(endpoint, params)
+        await self._ensure_store_loaded()
+
+        # Once the connected realm id is known a status poll is a single request
+        connected_realm_id = self._connected_realm_ids.get(realm_slug)
+        if connected_realm_id is None:
+            realm_info = await self.get_realm_info(realm, raise_for_status)
+            connected_realm_id = self._parse_connected_realm_id(realm_info)
+            if connected_realm_id is None:
+                return {}
+            self._connected_realm_ids[realm_slug] = connected_realm_id
+            await self._save_store()
+
+        endpoint = f"/data/wow/connected-realm/{connected_realm_id}"
+        params = self._dynamic_params
+        return await self._make_request(endpoint, params, raise_for_status)
+
+    async def prefill_connected_realm_ids(self) -> None:
+        """Learn every realm's connected realm id from one search request.
+
+        Afterwards get_connected_realm needs no realm lookup for any realm in
+        the region; the mapping is persisted with the token.
+        """
+        await self._ensure_store_loaded()
+        results = await self._make_request(
+            "/data/wow/search/connected-realm",
+            {**self._dynamic_params, "_pageSize": 1000},
+            cacheable=False,
+        )
+
+        connected_realm_ids = {
+            realm["slug"]: result["data"]["id"]
+            for result in results.get("results", [])
+            if "id" in result.get("data", {})
+            for realm in result["data"].get("realms", [])
+            if "slug" in realm
+        }
+        if connected_realm_ids.items() - self._connected_realm_ids.items():
+            self._connected_realm_ids.update(connected_realm_ids)
+            await self._save_store()
+
+    @staticmethod
+    def _parse_connected_realm_id(realm_info: Dict[str, Any]) -> Optional[int]:
+        """Extract the connected realm id from a realm's connected_realm link."""
+        href = realm_info.get("connected_realm", {}).get("href", "")
+        match = re.search(r"/connected-realm/(\d+)", href)
+        return int(match.group(1)) if match else None
 
     # === PvP Methods ===
     
-    async def get_character_pvp_summary(self, realm: str, character_name: str) -> Dict[str, Any]:
-        """Get character PvP summary."""
-        realm_slug = self.realm_to_slug(realm)
-        endpoint = f"/profile/wow/character/{realm_slug}/{character_name.lower()}/pvp-summary"
-        params = {"namespace": f"profile-{self.region}"}
-        return await self._make_request(endpoint, params)
+    get_character_pvp_summary = _character_endpoint("/pvp-summary", "Get character PvP summary.")
 
-    async def get_character_pvp_bracket(self, realm: str, character_name: str, bracket: str) -> Dict[str, Any]:
+    async def get_character_pvp_bracket(
+        self, realm: str, character_name: str, bracket: str, raise_for_status: bool = False
+    ) -> Dict[str, Any]:
         """Get character PvP bracket statistics."""
-        realm_slug = self.realm_to_slug(realm)
-        endpoint = f"/profile/wow/character/{realm_slug}/{character_name.lower()}/pvp-bracket/{bracket}"
-        params = {"namespace": f"profile-{self.region}"}
-        return await self._make_request(endpoint, params)
+        endpoint = f"{self._character_base(realm, character_name)}/pvp-bracket/{bracket}"
+        params = self._profile_params
+        return await self._make_request(endpoint, params, raise_for_status)
+
+    async def get_all_pvp_data(
+        self, realm: str, character_name: str, raise_for_status: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get all PvP data for character.
+
+        A bracket the character has not played comes back as 404 and is
+        empty data either way; with raise_for_status any other failure is
+        raised instead of leaving its slot empty.
+        """
+        brackets = tuple(PVP_BRACKETS.values())
+
+        # Summary and brackets are independent, so fetch them together
+        responses = await asyncio.gather(
+            self.get_character_pvp_summary(realm, character_name, raise_for_status),
+            *(
+                self.get_character_pvp_bracket(realm, character_name, bracket, raise_for_status)
+                for bracket in brackets
+            ),
+            return_exceptions=True,
+        )
 
-    async def get_all_pvp_data(self, realm: str, character_name: str) -> Dict[str, Dict[str, Any]]:
-        """Get all PvP data for character."""
+        # A failed slot becomes empty data instead of discarding the others
         results = {}
-        
-        # Get PvP summary
-        summary = await self.get_character_pvp_summary(realm, character_name)
-        results["summary"] = summary
-        
-        # Get bracket data
-        brackets = ["2v2", "3v3", "rbg"]
-        for bracket in brackets:
-            bracket_data = await self.get_character_pvp_bracket(realm, character_name, bracket)
-            results[bracket] = bracket_data
-            await asyncio.sleep(0.1)  # Rate limiting
-        
+        for key, response in zip(("summary", *brackets), responses):
+            if isinstance(response, WoWNotFound):
+                response = {}
+            elif isinstance(response, BaseException):
+                if raise_for_status:
+                    raise response
+                _LOGGER.error(f"Error fetching PvP {key} for {character_name}-{realm}: {response}")
+                response = {}
+            results[key] = response
         return results
 
     # === Raid Methods ===
     
-    async def get_character_encounters_raids(self, realm: str, character_name: str) -> Dict[str, Any]:
-        """Get character raid encounters."""
-        realm_slug = self.realm_to_slug(realm)
-        endpoint = f"/profile/wow/character/{realm_slug}/{character_name.lower()}/encounters/raids"
-        params = {"namespace": f"profile-{self.region}"}
-        return await self._make_request(endpoint, params)
+    get_character_encounters_raids = _character_endpoint("/encounters/raids", "Get character raid encounters.")
 
     # === Mythic+ Methods ===
     
-    async def get_character_mythicplus_profile(self, realm: str, character_name: str) -> Dict[str, Any]:
-        """Get character Mythic+ profile."""
-        realm_slug = self.realm_to_slug(realm)
-        endpoint = f"/profile/wow/character/{realm_slug}/{character_name.lower()}/mythic-keystone-profile"
-        params = {"namespace": f"profile-{self.region}"}
-        return await self._make_request(endpoint, params)
+    get_character_mythicplus_profile = _character_endpoint("/mythic-keystone-profile", "Get character Mythic+ profile.")
+
+    async def _current_season_id(
+        self,
+        realm: str,
+        character_name: str,
+        profile: Optional[Dict[str, Any]] = None,
+        raise_for_status: bool = False,
+    ) -> int:
+        """Current Mythic+ season id for a character, cached for an hour.
+
+        Seasons change a few times a year, so the keystone profile is only
+        needed to derive it when the cached id has expired.
+        """
+        key = (realm, character_name)
+        cached = self._season_ids.get(key)
+        if cached and time.monotonic() - cached[1] < SEASON_ID_CACHE_TTL:
+            return cached[0]
+
+        if profile is None:
+            profile = await self.get_character_mythicplus_profile(
+                realm, character_name, raise_for_status
+            )
+        seasons = profile.get("seasons", [])
+        if not seasons:
+            # Fallback: default season id
+            return 1
+        # The highest id is the current season
+        season_id = max(s.get("id", 0) for s in seasons)
+        self._season_ids[key] = (season_id, time.monotonic())
+        return season_id
 
-    async def get_character_mythicplus_season(self, realm: str, character_name: str, season_id: int = None) -> Dict[str, Any]:
-        """Get character Mythic+ season data. Holt automatisch die aktuelle Season-ID aus dem Keystone-Profile."""
+    async def get_character_mythicplus_season(
+        self,
+        realm: str,
+        character_name: str,
+        season_id: int = None,
+        raise_for_status: bool = False,
+    ) -> Dict[str, Any]:
+        """Get character Mythic+ season data, defaulting to the current season."""
         if season_id is None:
-            profile = await self.get_character_mythicplus_profile(realm, character_name)
-            seasons = profile.get("seasons", [])
-            if seasons:
-                # Nimm die höchste ID als aktuelle Season
-                season_id = max(s.get("id", 0) for s in seasons)
-            else:
-                # Fallback: Standard-Season-ID
-                season_id = 1
-        realm_slug = self.realm_to_slug(realm)
-        endpoint = f"/profile/wow/character/{realm_slug}/{character_name.lower()}/mythic-keystone-profile/season/{season_id}"
-        params = {"namespace": f"profile-{self.region}"}
-        return await self._make_request(endpoint, params)
+            season_id = await self._current_season_id(
+                realm, character_name, raise_for_status=raise_for_status
+            )
+        endpoint = f"{self._character_base(realm, character_name)}/mythic-keystone-profile/season/{season_id}"
+        params = self._profile_params
+        return await self._make_request(endpoint, params, raise_for_status)
+
+    async def _mythicplus_season_or_empty(
+        self, realm: str, character_name: str, season_id: int, raise_for_status: bool
+    ) -> Dict[str, Any]:
+        """Season data, or empty data when the character has no run this season (404)."""
+        try:
+            return await self.get_character_mythicplus_season(
+                realm, character_name, season_id, raise_for_status
+            )
+        except WoWNotFound:
+            return {}
+
+    async def get_character_mythicplus_all(
+        self, realm: str, character_name: str, raise_for_status: bool = False
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Get the Mythic+ profile and current season data together."""
+        key = (realm, character_name)
+        cached = self._season_ids.get(key)
+        if cached and time.monotonic() - cached[1] < SEASON_ID_CACHE_TTL:
+            # Season already known: both requests can go out at once
+            return await asyncio.gather(
+                self.get_character_mythicplus_profile(realm, character_name, raise_for_status),
+                self._mythicplus_season_or_empty(
+                    realm, character_name, cached[0], raise_for_status
+                ),
+            )
+
+        profile = await self.get_character_mythicplus_profile(realm, character_name, raise_for_status)
+        season_id = await self._current_season_id(realm, character_name, profile)
+        season = await self._mythicplus_season_or_empty(
+            realm, character_name, season_id, raise_for_status
+        )
+        return profile, season
 
     # === Guild Methods ===
     
@@ -275,50 +968,83 @@ class WoWBlizzardAPIClient:
         """Get guild information."""
         realm_slug = self.realm_to_slug(realm)
         endpoint = f"/data/wow/guild/{realm_slug}/{guild_name.lower().replace(' ', '-')}"
-        params = {"namespace": f"profile-{self.region}"}
+        params = self._profile_params
         return await self._make_request(endpoint, params)
 
     # === Multi-character support ===
     
+    async def _bulk_get(
+        self, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Any]:
+        """Issue (endpoint, params) requests concurrently, results in call order.
+
+        Concurrency is bounded by the semaphore in _request_with_retry; a failed
+        call yields its exception in its slot instead of failing the batch.
+        """
+        return await asyncio.gather(
+            *(self._make_request(endpoint, params) for endpoint, params in calls),
+            return_exceptions=True,
+        )
+
     async def get_multiple_character_data(self, characters: List[Dict[str, str]]) -> Dict[str, Dict[str, Any]]:
         """Get data for multiple characters."""
-        results = {}
-        
-        for char in characters:
+        kinds = {"profile": "", "equipment": "/equipment", "achievements": "/achievements"}
+
+        async def _fetch_character(char: Dict[str, str]) -> Tuple[str, Dict[str, Any]]:
             realm = char["realm"]
             name = char["character_name"]  # Fixed key name
             char_key = f"{realm}-{name}"
-            
-            try:
-                profile = await self.get_character_profile(realm, name)
-                equipment = await self.get_character_equipment(realm, name)
-                achievements = await self.get_character_achievements(realm, name)
-                
-                results[char_key] = {
-                    "profile": profile,
-                    "equipment": equipment, 
-                    "achievements": achievements,
-                    "realm": realm,
-                    "name": name,
-                }
-                
-                # Rate limiting between characters
-                await asyncio.sleep(0.2)
-                
-            except Exception as e:
-                _LOGGER.error(f"Error fetching data for {char_key}: {e}")
-                results[char_key] = {
-                    "profile": {},
-                    "equipment": {},
-                    "achievements": {},
-                    "realm": realm,
-                    "name": name,
-                    "error": str(e)
-                }
-        
-        return results
+            base = self._character_base(realm, name)
+
+            responses = await self._bulk_get(
+                [(f"{base}{suffix}", self._profile_params) for suffix in kinds.values()]
+            )
+
+            data: Dict[str, Any] = {"realm": realm, "name": name}
+            for kind, response in zip(kinds, responses):
+                if isinstance(response, BaseException):
+                    _LOGGER.error(f"Error fetching {kind} for {char_key}: {response}")
+                    data.setdefault("error", str(response))
+                    response = {}
+                data[kind] = response
+            return char_key, data
+
+        # One task per character, each fetching its endpoints concurrently;
+        # admission is bounded centrally by the semaphore in _request_with_retry
+        return dict(await asyncio.gather(*(_fetch_character(char) for char in characters)))
 
     async def close(self):
-        """Close the session."""
-        if self._session:
-            await self._session.close()
\ No newline at end of file
+        """Stop background refreshes and close the session if this client created it."""
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._owns_session and self._session:
+            await self._session.close()
+            self._session = None
+
+
+class WoWAPIError(Exception):
+    """Error talking to the Blizzard API."""
+
+    def __init__(
+        self, message: str = "", status: Optional[int] = None, retry_after: Optional[str] = None
+    ):
+        """Initialize with the HTTP status and Retry-After header, when known."""
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class WoWNotFound(WoWAPIError):
+    """Error to indicate the requested resource does not exist."""
+
+
+class WoWAuthError(WoWAPIError):
+    """Error to indicate the credentials or access token were rejected."""
+
+
+class WoWRateLimited(WoWAPIError):
+    """Error to indicate Blizzard throttled the request."""
@@ -1,12 +1,15 @@
 """Config flow realm selector"""
 import asyncio
 import logging
+import random
+import time
+from operator import itemgetter
 import voluptuous as vol
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import selector
@@ -19,16 +22,35 @@ from .const import (
     CONF_REALM,
     CONF_CHARACTER_NAME,
     CONF_CHARACTERS,
+    CONF_BULK_CHARACTERS,
     CONF_ENABLE_SERVER_STATUS,
     CONF_ENABLE_PVP,
     CONF_ENABLE_RAIDS,
     CONF_ENABLE_MYTHIC_PLUS,
     DEFAULT_REGION,
+    RETRYABLE_STATUS_CODES,
+    BULK_VALIDATION_CONCURRENCY,
+    VALIDATION_TIMEOUT,
+    REALMS_TTL,
+    CHARACTER_VALIDATION_TTL,
+)
+from . import asyncio_timeout, get_shared_client, release_shared_client
+from .api_client import (
+    WoWAPIError,
+    WoWAuthError,
+    WoWBlizzardAPIClient,
+    WoWNotFound,
+    token_cache_key,
 )
-from .api_client import WoWBlizzardAPIClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# Realm index per credential hash (see token_cache_key); the list changes at
+# most daily
+_realm_cache: dict[str, tuple[float, dict]] = {}
+# Recently validated characters, keyed by (region, realm, name)
+_character_cache: dict[tuple[str, str, str], tuple[float, dict]] = {}
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_CLIENT_ID): str,
@@ -64,109 +86,291 @@ STEP_CHARACTER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+STEP_CONFIRM_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Optional("add_another", default=False): bool,
+        vol.Optional("add_bulk", default=False): bool,
+    }
+)
+
+STEP_BULK_CHARACTERS_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_BULK_CHARACTERS): selector.TextSelector(
+            selector.TextSelectorConfig(multiline=True)
+        ),
+    }
+)
+
+
+# The Home Assistant version cannot change at runtime, so pick the newest
+# selector mode it offers once: COMBOBOX (HA 2024.2+) takes custom values and
+# sorts, LIST (HA 2023.8+) takes custom values, DROPDOWN (older) neither.
+_SELECT_MODE_NAME = next(
+    (name for name in ("COMBOBOX", "LIST") if hasattr(selector.SelectSelectorMode, name)),
+    "DROPDOWN",
+)
+_SELECT_MODE = getattr(selector.SelectSelectorMode, _SELECT_MODE_NAME)
+_SUPPORTS_CUSTOM_VALUE = _SELECT_MODE_NAME in ("COMBOBOX", "LIST")
+_SUPPORTS_SORT = _SELECT_MODE_NAME == "COMBOBOX"
+
 
 def get_compatible_select_mode():
     """Get compatible select mode based on HA version."""
-    try:
-        # Try new COMBOBOX mode (HA 2024.2+)
-        return selector.SelectSelectorMode.COMBOBOX
-    except AttributeError:
-        try:
-            # Fallback to LIST mode with custom_value (HA 2023.8+)
-            return selector.SelectSelectorMode.LIST
-        except AttributeError:
-            # Final fallback to DROPDOWN (older HA versions)
-            return selector.SelectSelectorMode.DROPDOWN
+    return _SELECT_MODE
 
 
 def create_realm_selector_config(realm_options: List[Dict[str, str]]) -> selector.SelectSelectorConfig:
     """Create realm selector config compatible with current HA version."""
+    config = {"options": realm_options, "mode": _SELECT_MODE}
+    if _SUPPORTS_CUSTOM_VALUE:
+        config["custom_value"] = True
+    else:
+        _LOGGER.info("Using fallback DROPDOWN selector for realm selection")
+    if _SUPPORTS_SORT:
+        config["sort"] = True
+    return selector.SelectSelectorConfig(**config)
+
+
+async def _retry(coro_factory, *, attempts: int = 3, base: float = 0.5, max_delay: float = 8):
+    """Await coro_factory() with a timeout, retrying throttled and transient errors.
+
+    Only 429 and 5xx responses are retried; the delay doubles per attempt with
+    a little jitter, and a Retry-After header from Blizzard takes precedence.
+    A Retry-After longer than max_delay is not waited out in the UI.
+    """
+    for attempt in range(attempts):
+        try:
+            async with asyncio_timeout(VALIDATION_TIMEOUT):
+                return await coro_factory()
+        except WoWAPIError as err:
+            if err.status not in RETRYABLE_STATUS_CODES or attempt == attempts - 1:
+                raise
+            delay = min(base * 2 ** attempt, max_delay)
+            retry_after = err.retry_after or ""
+            if retry_after.isdigit():
+                delay = float(retry_after)
+                if delay > max_delay:
+                    raise
+            _LOGGER.debug("Blizzard API returned %s, retrying in %.1fs", err.status, delay)
+            await asyncio.sleep(delay + random.uniform(0, 0.25))
+
+
+async def _cached_realms(client: WoWBlizzardAPIClient, region: str) -> dict[str, any]:
+    """Get the realm index, reusing a recent result for the same credentials."""
+    key = token_cache_key(client.client_id, client.client_secret, region)
+    now = time.monotonic()
+    # Drop expired entries so nothing lingers for credentials no longer used
+    for stale in [k for k, (fetched, _) in _realm_cache.items() if now - fetched >= REALMS_TTL]:
+        del _realm_cache[stale]
+    cached = _realm_cache.get(key)
+    if cached:
+        return cached[1]
+
+    realms = await _retry(lambda: client.get_all_realms(raise_for_status=True))
+    if realms and "realms" in realms:
+        _realm_cache[key] = (time.monotonic(), realms)
+    return realms
+
+
+async def validate_api_credentials(client: WoWBlizzardAPIClient, data: dict[str, any]) -> dict[str, any]:
+    """Validate the API credentials by making a test call."""
     try:
-        # Try newest approach first (HA 2024.2+)
-        return selector.SelectSelectorConfig(
-            options=realm_options,
-            mode=selector.SelectSelectorMode.COMBOBOX,
-            custom_value=True,
-            sort=True,
+        # Get ALL realms (no limit!)
+        realms = await _cached_realms(client, data[CONF_REGION])
+    except WoWAPIError as e:
+        _LOGGER.debug("WoW API rejected realm request: %s", e.status)
+        _invalidate_realms(client, data[CONF_REGION])
+        if isinstance(e, WoWAuthError):
+            raise InvalidAuth from e
+        raise CannotConnect from e
+    except Exception as e:
+        _LOGGER.debug("Cannot connect to WoW API: %r", e)
+        _invalidate_realms(client, data[CONF_REGION])
+        raise CannotConnect from e
+
+    if not realms or "realms" not in realms:
+        _LOGGER.debug("Unable to fetch realms - API credentials may be invalid")
+        raise CannotConnect
+
+    # Sort realms alphabetically for better UX and turn them straight into
+    # selector options; nothing else in the flow needs the raw realm objects
+    sorted_realms = sorted(
+        (realm for realm in realms["realms"] if "name" in realm and "slug" in realm),
+        key=itemgetter("name"),
+    )
+    realm_options = [{"value": realm["slug"], "label": realm["name"]} for realm in sorted_realms]
+
+    _LOGGER.info("Loaded %s realms for region %s", len(realm_options), data[CONF_REGION])
+
+    return {"realms": realm_options}
+
+
+def _invalidate_realms(client: WoWBlizzardAPIClient, region: str) -> None:
+    """Drop the cached realm index for these credentials."""
+    _realm_cache.pop(token_cache_key(client.client_id, client.client_secret, region), None)
+
+
+def _character_cache_key(client: WoWBlizzardAPIClient, character: dict[str, str]) -> tuple[str, str, str]:
+    """Build the validation cache key for a character."""
+    return (
+        client.region,
+        character[CONF_REALM].lower(),
+        character[CONF_CHARACTER_NAME].lower(),
+    )
+
+
+def _get_cached_character(client: WoWBlizzardAPIClient, character: dict[str, str]) -> dict[str, any] | None:
+    """Return a recent validation result for the character, if any."""
+    cached = _character_cache.get(_character_cache_key(client, character))
+    if cached and time.monotonic() - cached[0] < CHARACTER_VALIDATION_TTL:
+        return cached[1]
+    return None
+
+
+async def _fetch_profile(client: WoWBlizzardAPIClient, character: dict[str, str]) -> dict[str, any]:
+    """Fetch a character profile, retrying transient errors."""
+    return await _retry(
+        lambda: client.get_character_profile(
+            character[CONF_REALM],
+            character[CONF_CHARACTER_NAME],
+            raise_for_status=True,
         )
-    except AttributeError:
-        try:
-            # Try LIST mode with custom_value (HA 2023.8+)
-            return selector.SelectSelectorConfig(
-                options=realm_options,
-                mode=selector.SelectSelectorMode.LIST,
-                custom_value=True,
-            )
-        except AttributeError:
-            # Fallback to basic DROPDOWN (older HA versions)
-            _LOGGER.info("Using fallback DROPDOWN selector for realm selection")
-            return selector.SelectSelectorConfig(
-                options=realm_options,
-                mode=selector.SelectSelectorMode.DROPDOWN,
-            )
+    )
 
 
-async def validate_api_credentials(hass: HomeAssistant, data: dict[str, any]) -> dict[str, any]:
-    """Validate the API credentials by making a test call."""
-    client = WoWBlizzardAPIClient(
-        data[CONF_CLIENT_ID], 
-        data[CONF_CLIENT_SECRET], 
-        data[CONF_REGION]
+async def _fetch_profiles(client: WoWBlizzardAPIClient, characters: List[Dict[str, str]]) -> List[Any]:
+    """Fetch several character profiles concurrently over the shared session.
+
+    Each task takes the semaphore itself, so at most
+    BULK_VALIDATION_CONCURRENCY requests are in flight at once.
+    """
+    semaphore = asyncio.Semaphore(BULK_VALIDATION_CONCURRENCY)
+
+    async def _fetch(character: Dict[str, str]) -> Dict[str, Any]:
+        async with semaphore:
+            return await _fetch_profile(client, character)
+
+    return await asyncio.gather(
+        *(_fetch(character) for character in characters),
+        return_exceptions=True,
     )
 
-    try:
-        # Get ALL realms (no limit!)
-        realms = await client.get_all_realms()
-        
-        if not realms or "realms" not in realms:
-            raise CannotConnect("Unable to fetch realms - API credentials may be invalid")
-        
-        # Sort realms alphabetically for better UX
-        sorted_realms = sorted(realms.get("realms", []), key=lambda x: x.get("name", ""))
-        
-        _LOGGER.info(f"Loaded {len(sorted_realms)} realms for region {data[CONF_REGION]}")
-        
-        return {"realms": sorted_realms}
-        
-    except Exception as e:
-        _LOGGER.error("Cannot connect to WoW API: %s", e)
-        raise CannotConnect(f"Cannot connect: {e}")
-    finally:
-        await client.close()
 
+def _character_info(
+    client: WoWBlizzardAPIClient, character: dict[str, str], character_data: dict[str, any]
+) -> dict[str, any]:
+    """Extract and cache the character summary from a profile response."""
+    if not character_data or "name" not in character_data:
+        _LOGGER.debug(
+            "Character %s not found on %s",
+            character[CONF_CHARACTER_NAME], character[CONF_REALM],
+        )
+        raise CharacterNotFound
+
+    character_info = {
+        "name": character_data["name"],
+        "level": character_data.get("level", "Unknown"),
+        "character_class": character_data.get("character_class", {}).get("name", "Unknown"),
+        "race": character_data.get("race", {}).get("name", "Unknown"),
+        "realm": character_data.get("realm", {}).get("name", character[CONF_REALM]),
+    }
+    _character_cache[_character_cache_key(client, character)] = (time.monotonic(), character_info)
+    return character_info
+
+
+def _character_error(err: Exception) -> HomeAssistantError:
+    """Map a failed profile lookup to the error shown in the flow.
+
+    Only the error type reaches the UI, so the message stays empty and the
+    details go to the debug log.
+    """
+    _LOGGER.debug("Character lookup failed: %r", err)
+    if isinstance(err, WoWNotFound):
+        return CharacterNotFound()
+    if isinstance(err, WoWAuthError):
+        return InvalidAuth()
+    return CannotConnect()
 
-async def validate_character(hass: HomeAssistant, data: dict[str, any], character: dict[str, str]) -> dict[str, any]:
+
+async def validate_character(client: WoWBlizzardAPIClient, character: dict[str, str]) -> dict[str, any]:
     """Validate that a character exists."""
-    client = WoWBlizzardAPIClient(
-        data[CONF_CLIENT_ID], 
-        data[CONF_CLIENT_SECRET], 
-        data[CONF_REGION]
-    )
+    if cached := _get_cached_character(client, character):
+        return cached
 
     try:
         # Test connection by getting character profile
-        character_data = await client.get_character_profile(
-            character[CONF_REALM], 
-            character[CONF_CHARACTER_NAME]
-        )
-        
-        if not character_data or "name" not in character_data:
-            raise CharacterNotFound(f"Character {character[CONF_CHARACTER_NAME]} not found on {character[CONF_REALM]}")
-            
-        return {
-            "name": character_data["name"],
-            "level": character_data.get("level", "Unknown"),
-            "character_class": character_data.get("character_class", {}).get("name", "Unknown"),
-            "race": character_data.get("race", {}).get("name", "Unknown"),
-            "realm": character_data.get("realm", {}).get("name", character[CONF_REALM]),
-        }
-        
+        character_data = await _fetch_profile(client, character)
     except Exception as e:
-        if "not found" in str(e).lower():
-            raise CharacterNotFound(f"Character not found: {e}")
-        raise CannotConnect(f"Cannot connect: {e}")
-    finally:
-        await client.close()
+        raise _character_error(e) from e
+
+    return _character_info(client, character, character_data)
+
+
+async def validate_characters(
+    client: WoWBlizzardAPIClient, characters: List[Dict[str, str]]
+) -> List[Any]:
+    """Validate several characters concurrently.
+
+    Returns one entry per character, in order: either the character info or
+    the exception raised while validating it, so a single failure does not
+    abort the whole batch.
+    """
+    results: List[Any] = [_get_cached_character(client, c) for c in characters]
+    pending = [i for i, result in enumerate(results) if result is None]
+
+    profiles = await _fetch_profiles(client, [characters[i] for i in pending])
+    for i, profile in zip(pending, profiles):
+        if isinstance(profile, BaseException):
+            results[i] = _character_error(profile)
+            continue
+        try:
+            results[i] = _character_info(client, characters[i], profile)
+        except CharacterNotFound as err:
+            results[i] = err
+
+    return results
+
+
+def _canonical_character(character: Dict[str, str]) -> Dict[str, str]:
+    """Return the character with realm and name in Blizzard's case-insensitive form."""
+    return {
+        CONF_REALM: character[CONF_REALM].strip().lower(),
+        CONF_CHARACTER_NAME: character[CONF_CHARACTER_NAME].strip().lower(),
+    }
+
+
+def _character_key(character: Dict[str, str]) -> Tuple[str, str]:
+    """Build the (realm slug, name) key used to detect duplicate characters.
+
+    The realm is slugged so "Twisting Nether" from a bulk line matches the
+    selector's "twisting-nether". A tuple keeps realm "foo-bar" / name "baz"
+    apart from realm "foo" / name "bar-baz", which a joined string would not.
+    """
+    canonical = _canonical_character(character)
+    return (
+        WoWBlizzardAPIClient.realm_to_slug(canonical[CONF_REALM]),
+        canonical[CONF_CHARACTER_NAME],
+    )
+
+
+def parse_bulk_characters(text: str) -> List[Dict[str, str]]:
+    """Parse one "Name-Realm" character per line, with the realm slugged."""
+    characters = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        name, separator, realm = line.partition("-")
+        if not separator or not name.strip() or not realm.strip():
+            _LOGGER.debug("Invalid character line: %s", line)
+            raise InvalidBulkFormat
+        # Store the realm as a slug, like the realm selector does, so the same
+        # realm never ends up configured under two spellings
+        characters.append({
+            CONF_REALM: WoWBlizzardAPIClient.realm_to_slug(realm),
+            CONF_CHARACTER_NAME: name.strip(),
+        })
+    return characters
 
 
 class WoWBlizzardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -179,6 +383,12 @@ class WoWBlizzardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize."""
         self.data = {}
         self.characters = []
+        self._character_keys: set[Tuple[str, str]] = set()
+        self._character_schema: vol.Schema | None = None
+        self._total_realms = 0
+        self._entry_unique_id: str | None = None
+        self._client: WoWBlizzardAPIClient | None = None
+        self._client_credentials: tuple[str, str, str] | None = None
         self.current_character = {}
 
     async def async_step_user(
@@ -197,7 +407,11 @@ class WoWBlizzardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         try:
-            info = await validate_api_credentials(self.hass, user_input)
+            client = self._acquire_client(user_input)
+            info = await validate_api_credentials(client, user_input)
+            # Learn the connected realm ids in the background so server status
+            # polls later need a single request per realm
+            self.hass.async_create_task(client.prefill_connected_realm_ids())
             self.data.update(user_input)
             self.data["available_realms"] = info.get("realms", [])
             return await self.async_step_features()
@@ -239,89 +453,184 @@ class WoWBlizzardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle character addition step with COMPATIBLE realm selector."""
         if user_input is None:
-            # Create realm selector from ALL available realms
-            realm_options = []
-            if "available_realms" in self.data:
-                realm_options = [
-                    {"value": realm["slug"], "label": realm["name"]}
-                    for realm in self.data["available_realms"]  # ALL REALMS!
-                ]
-                
-                _LOGGER.info(f"Showing {len(realm_options)} realms with compatible selector")
-            
-            if realm_options:
-                # Use version-compatible selector
-                try:
-                    selector_config = create_realm_selector_config(realm_options)
-                    schema = vol.Schema({
-                        vol.Required(CONF_REALM): selector.SelectSelector(selector_config),
-                        vol.Required(CONF_CHARACTER_NAME): str,
-                    })
-                    _LOGGER.info("Using enhanced realm selector")
-                except Exception as e:
-                    # Ultimate fallback to text input
-                    _LOGGER.warning(f"Selector creation failed ({e}), using text input")
-                    schema = STEP_CHARACTER_DATA_SCHEMA
-            else:
-                # Fallback to text input if no realms loaded
-                schema = STEP_CHARACTER_DATA_SCHEMA
-                _LOGGER.warning("No realms loaded, falling back to text input")
-
-            return self.async_show_form(
-                step_id="character",
-                data_schema=schema,
-                description_placeholders={
-                    "character_count": len(self.characters),
-                    "total_realms": len(self.data.get("available_realms", [])),
-                    "help_text": "Select your realm from the list, or type manually if not found"
-                }
-            )
+            return self._show_character_form()
 
         errors = {}
+        character = {
+            CONF_REALM: user_input[CONF_REALM].strip(),
+            CONF_CHARACTER_NAME: user_input[CONF_CHARACTER_NAME].strip(),
+        }
+
+        # Check if character already exists before asking Blizzard about it
+        if _character_key(character) in self._character_keys:
+            errors["base"] = "character_already_added"
+            return self._show_character_form(errors)
 
         try:
-            character_info = await validate_character(self.hass, self.data, user_input)
-            
-            # Check if character already exists
-            char_key = f"{user_input[CONF_REALM]}-{user_input[CONF_CHARACTER_NAME]}"
-            existing_chars = [
-                f"{c[CONF_REALM]}-{c[CONF_CHARACTER_NAME]}" for c in self.characters
-            ]
-            
-            if char_key in existing_chars:
-                errors["base"] = "character_already_added"
-            else:
-                # Add character to list
-                character_data = {
-                    CONF_REALM: user_input[CONF_REALM],
-                    CONF_CHARACTER_NAME: user_input[CONF_CHARACTER_NAME],
-                    "display_name": f"{character_info['name']} - {character_info['realm']}",
-                    "level": character_info["level"],
-                    "character_class": character_info["character_class"],
-                    "race": character_info["race"],
-                }
-                self.characters.append(character_data)
-                return await self.async_step_character_confirm()
-                
+            character_info = await validate_character(
+                self._get_client(), _canonical_character(character)
+            )
+            self._add_character(character, character_info)
+            return await self.async_step_character_confirm()
+
         except CharacterNotFound:
             errors["base"] = "character_not_found"
         except CannotConnect:
             errors["base"] = "cannot_connect"
+        except InvalidAuth:
+            errors["base"] = "invalid_auth"
         except Exception:
             _LOGGER.exception("Unexpected exception validating character")
             errors["base"] = "unknown"
 
+        return self._show_character_form(errors)
+
+    def _get_client(self) -> WoWBlizzardAPIClient:
+        """Return the client validated in the user step."""
+        if self._client is None:
+            return self._acquire_client(self.data)
+        return self._client
+
+    def _acquire_client(self, data: dict[str, any]) -> WoWBlizzardAPIClient:
+        """Hold the shared client for these credentials for the rest of the flow.
+
+        The client (and its token) is kept for the later steps; one held for
+        credentials entered earlier is let go.
+        """
+        credentials = (data[CONF_REGION], data[CONF_CLIENT_ID], data[CONF_CLIENT_SECRET])
+        if self._client_credentials not in (None, credentials):
+            release_shared_client(self.hass, *self._client_credentials, self.flow_id)
+        self._client = get_shared_client(self.hass, *credentials, self.flow_id)
+        self._client_credentials = credentials
+        return self._client
+
+    @callback
+    def async_remove(self) -> None:
+        """Release the flow's client when the flow ends.
+
+        A created entry holds the client itself; otherwise nobody uses it any
+        more and it is closed instead of renewing its token until restart.
+        """
+        if self._client_credentials is not None:
+            release_shared_client(self.hass, *self._client_credentials, self.flow_id)
+            self._client_credentials = None
+            self._client = None
+
+    def _show_character_form(self, errors: dict[str, str] | None = None) -> FlowResult:
+        """Show the character form."""
         return self.async_show_form(
             step_id="character",
-            data_schema=STEP_CHARACTER_DATA_SCHEMA,
+            data_schema=self._get_character_schema(),
             errors=errors,
             description_placeholders={
                 "character_count": len(self.characters),
-                "total_realms": len(self.data.get("available_realms", [])),
+                "total_realms": self._total_realms,
                 "help_text": "Select your realm from the list, or type manually if not found"
             }
         )
 
+    def _get_character_schema(self) -> vol.Schema:
+        """Build the character schema once; the realm list is fixed for the flow."""
+        if self._character_schema is not None:
+            return self._character_schema
+
+        # The realm list is only needed to build the selector, so drop it
+        # from the flow data instead of carrying it into the config entry.
+        realm_options = self.data.pop("available_realms", [])
+        self._total_realms = len(realm_options)
+
+        if realm_options:
+            # Create realm selector from ALL available realms
+            _LOGGER.info("Showing %s realms with compatible selector", len(realm_options))
+
+            # Use version-compatible selector
+            try:
+                selector_config = create_realm_selector_config(realm_options)
+                schema = vol.Schema({
+                    vol.Required(CONF_REALM): selector.SelectSelector(selector_config),
+                    vol.Required(CONF_CHARACTER_NAME): str,
+                })
+                _LOGGER.info("Using enhanced realm selector")
+            except Exception as e:
+                # Ultimate fallback to text input
+                _LOGGER.warning("Selector creation failed (%s), using text input", e)
+                schema = STEP_CHARACTER_DATA_SCHEMA
+        else:
+            # Fallback to text input if no realms loaded
+            schema = STEP_CHARACTER_DATA_SCHEMA
+            _LOGGER.warning("No realms loaded, falling back to text input")
+
+        self._character_schema = schema
+        return schema
+
+    def _add_character(self, character: Dict[str, str], character_info: Dict[str, Any]) -> None:
+        """Add a validated character to the list."""
+        self.characters.append({
+            CONF_REALM: character[CONF_REALM],
+            CONF_CHARACTER_NAME: character[CONF_CHARACTER_NAME],
+            "display_name": f"{character_info['name']} - {character_info['realm']}",
+            "level": character_info["level"],
+            "character_class": character_info["character_class"],
+            "race": character_info["race"],
+        })
+        self._character_keys.add(_character_key(character))
+        self._entry_unique_id = None
+
+    async def async_step_bulk_characters(
+        self, user_input: dict[str, any] | None = None
+    ) -> FlowResult:
+        """Add several characters at once, validating them concurrently."""
+        errors = {}
+        placeholders = {"failed_characters": ""}
+
+        if user_input is not None:
+            try:
+                pending = parse_bulk_characters(user_input[CONF_BULK_CHARACTERS])
+            except InvalidBulkFormat:
+                errors["base"] = "invalid_bulk_format"
+                pending = []
+
+            # Skip characters that are already added or listed twice
+            seen = set(self._character_keys)
+            unique = []
+            for character in pending:
+                if (char_key := _character_key(character)) not in seen:
+                    seen.add(char_key)
+                    unique.append(character)
+            pending = unique
+
+            results = await validate_characters(
+                self._get_client(),
+                [_canonical_character(c) for c in pending],
+            )
+
+            failed = []
+            for character, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    _LOGGER.debug(
+                        "Bulk validation failed for %s-%s: %s",
+                        character[CONF_CHARACTER_NAME], character[CONF_REALM], result,
+                    )
+                    failed.append(f"{character[CONF_CHARACTER_NAME]}-{character[CONF_REALM]}")
+                else:
+                    self._add_character(character, result)
+
+            if failed:
+                errors["base"] = "bulk_characters_failed"
+                placeholders["failed_characters"] = ", ".join(failed)
+            elif not errors and self.characters:
+                return await self.async_step_character_confirm()
+
+        return self.async_show_form(
+            step_id="bulk_characters",
+            data_schema=STEP_BULK_CHARACTERS_DATA_SCHEMA,
+            errors=errors,
+            description_placeholders={
+                "character_count": len(self.characters),
+                **placeholders,
+            }
+        )
+
     async def async_step_character_confirm(
         self, user_input: dict[str, any] | None = None
     ) -> FlowResult:
@@ -331,9 +640,7 @@ class WoWBlizzardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             
             return self.async_show_form(
                 step_id="character_confirm",
-                data_schema=vol.Schema({
-                    vol.Optional("add_another", default=False): bool,
-                }),
+                data_schema=STEP_CONFIRM_DATA_SCHEMA,
                 description_placeholders={
                     "character_name": current_char["display_name"],
                     "character_level": current_char["level"],
@@ -343,6 +650,8 @@ class WoWBlizzardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 }
             )
 
+        if user_input.get("add_bulk", False):
+            return await self.async_step_bulk_characters()
         if user_input.get("add_another", False):
             return await self.async_step_character()
         else:
@@ -361,23 +670,21 @@ class WoWBlizzardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         else:
             title = f"WoW API ({len(self.characters)} characters)"
 
-        # Create unique ID from region and characters
-        char_ids = [f"{c[CONF_REALM]}-{c[CONF_CHARACTER_NAME]}" for c in self.characters]
-        unique_id = f"{self.data[CONF_REGION]}-{'-'.join(sorted(char_ids))}"
-        
+        # Create unique ID from region and characters, in the format entries
+        # have always used so re-adding configured characters is still caught
+        if self._entry_unique_id is None:
+            char_ids = sorted(f"{c[CONF_REALM]}-{c[CONF_CHARACTER_NAME]}" for c in self.characters)
+            self._entry_unique_id = f"{self.data[CONF_REGION]}-{'-'.join(char_ids)}"
+        unique_id = self._entry_unique_id
+
         await self.async_set_unique_id(unique_id)
         self._abort_if_unique_id_configured()
 
-        # Store character data
-        self.data[CONF_CHARACTERS] = self.characters
+        # Store character data, leaving out transient flow state like the realm list
+        data_to_store = {k: v for k, v in self.data.items() if k != "available_realms"}
+        data_to_store[CONF_CHARACTERS] = self.characters
 
-        return self.async_create_entry(title=title, data=self.data)
-
-    @staticmethod
-    @callback
-    def async_get_options_flow(config_entry):
-        """Get options flow."""
-        return WoWBlizzardOptionsFlowHandler(config_entry)
+        return self.async_create_entry(title=title, data=data_to_store)
 
 
 class WoWBlizzardOptionsFlowHandler(config_entries.OptionsFlow):
@@ -396,24 +703,10 @@ class WoWBlizzardOptionsFlowHandler(config_entries.OptionsFlow):
         
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema({
-                vol.Optional(
-                    CONF_ENABLE_SERVER_STATUS,
-                    default=self.config_entry.data.get(CONF_ENABLE_SERVER_STATUS, True)
-                ): bool,
-                vol.Optional(
-                    CONF_ENABLE_PVP,
-                    default=self.config_entry.data.get(CONF_ENABLE_PVP, True)
-                ): bool,
-                vol.Optional(
-                    CONF_ENABLE_RAIDS,
-                    default=self.config_entry.data.get(CONF_ENABLE_RAIDS, True)
-                ): bool,
-                vol.Optional(
-                    CONF_ENABLE_MYTHIC_PLUS,
-                    default=self.config_entry.data.get(CONF_ENABLE_MYTHIC_PLUS, True)
-                ): bool,
-            }),
+            # Reuse the feature schema, pre-filled with the current settings
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_FEATURES_DATA_SCHEMA, self.config_entry.data
+            ),
             description_placeholders={
                 "character_count": len(current_characters),
                 "compatibility": "Using Home Assistant version-compatible selectors"
@@ -421,6 +714,15 @@ class WoWBlizzardOptionsFlowHandler(config_entries.OptionsFlow):
         )
 
 
+@callback
+def _make_options_flow(config_entry):
+    """Get options flow."""
+    return WoWBlizzardOptionsFlowHandler(config_entry)
+
+
+WoWBlizzardConfigFlow.async_get_options_flow = staticmethod(_make_options_flow)
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
@@ -430,4 +732,8 @@ class InvalidAuth(HomeAssistantError):
 
 
 class CharacterNotFound(HomeAssistantError):
-    """Error to indicate character was not found."""
\ No newline at end of file
+    """Error to indicate character was not found."""
+
+
+class InvalidBulkFormat(HomeAssistantError):
+    """Error to indicate a bulk character line could not be parsed."""
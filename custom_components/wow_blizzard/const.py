@@ -1,4 +1,5 @@
 """Constants for the WoW Blizzard API integration"""
+from types import MappingProxyType
 
 DOMAIN = "wow_blizzard"
 
@@ -9,33 +10,41 @@ CONF_REGION = "region"
 CONF_REALM = "realm"
 CONF_CHARACTER_NAME = "character_name"
 CONF_CHARACTERS = "characters"
+CONF_BULK_CHARACTERS = "bulk_characters"
 CONF_ENABLE_SERVER_STATUS = "enable_server_status"
 CONF_ENABLE_PVP = "enable_pvp"
 CONF_ENABLE_RAIDS = "enable_raids"
 CONF_ENABLE_MYTHIC_PLUS = "enable_mythic_plus"
 
 # API URLs
-API_URLS = {
+API_URLS = MappingProxyType({
     "us": "https://us.api.blizzard.com",
     "eu": "https://eu.api.blizzard.com",
     "kr": "https://kr.api.blizzard.com",
     "tw": "https://tw.api.blizzard.com",
     "cn": "https://gateway.battlenet.com.cn",
-}
+})
 
-TOKEN_URLS = {
+TOKEN_URLS = MappingProxyType({
     "us": "https://us.battle.net/oauth/token",
     "eu": "https://eu.battle.net/oauth/token",
     "kr": "https://kr.battle.net/oauth/token",
     "tw": "https://tw.battle.net/oauth/token",
     "cn": "https://www.battlenet.com.cn/oauth/token",
-}
+})
 
 # Default values
 DEFAULT_REGION = "us"
 DEFAULT_SCAN_INTERVAL = 300  # 5 minutes
-FAST_SCAN_INTERVAL = 60     # 1 minute for PvP/M+ data
-SLOW_SCAN_INTERVAL = 900    # 15 minutes for server status
+FAST_SCAN_INTERVAL = 60     # 1 minute for PvP ratings and realm status
+SLOW_SCAN_INTERVAL = 900    # 15 minutes for raid progress and realm details
+REFRESH_COOLDOWN = 2.0      # Seconds to gather requested refreshes into one
+UPDATE_FETCH_TIMEOUT = 45   # Seconds one data group may take, below the fastest poll
+BULK_VALIDATION_CONCURRENCY = 16  # Parallel character lookups in the config flow
+VALIDATION_TIMEOUT = 10     # Seconds allowed per config-flow API call
+SETUP_TIMEOUT = 10          # Seconds allowed for the connectivity probe at setup
+REALMS_TTL = 21600          # 6 hours; realm lists change at most daily
+CHARACTER_VALIDATION_TTL = 60  # Reuse a character lookup within the same flow
 
 # Current expansion/season IDs (update these when new content releases)
 CURRENT_EXPANSION_ID = 10  # Dragonflight
@@ -43,7 +52,7 @@ CURRENT_SEASON_ID = 12     # Current M+ season
 CURRENT_PVP_SEASON_ID = 37 # Current PvP season
 
 # Sensor types - Basic Character Data
-BASIC_SENSOR_TYPES = {
+BASIC_SENSOR_TYPES = MappingProxyType({
     "character_level": {
         "name": "Level",
         "icon": "mdi:star",
@@ -74,10 +83,10 @@ BASIC_SENSOR_TYPES = {
         "unit": "gold",
         "device_class": None,
     },
-}
+})
 
 # Server Status Sensors
-SERVER_SENSOR_TYPES = {
+SERVER_SENSOR_TYPES = MappingProxyType({
     "realm_status": {
         "name": "Realm Status",
         "icon": "mdi:server",
@@ -96,10 +105,10 @@ SERVER_SENSOR_TYPES = {
         "unit": "minutes",
         "device_class": None,
     },
-}
+})
 
 # PvP Sensors
-PVP_SENSOR_TYPES = {
+PVP_SENSOR_TYPES = MappingProxyType({
     "pvp_2v2_rating": {
         "name": "2v2 Arena Rating",
         "icon": "mdi:sword-cross",
@@ -130,10 +139,10 @@ PVP_SENSOR_TYPES = {
         "unit": "wins",
         "device_class": None,
     },
-}
+})
 
 # Raid Progress Sensors  
-RAID_SENSOR_TYPES = {
+RAID_SENSOR_TYPES = MappingProxyType({
     "raid_progress_lfr": {
         "name": "LFR Progress",
         "icon": "mdi:castle",
@@ -164,10 +173,10 @@ RAID_SENSOR_TYPES = {
         "unit": "kills",
         "device_class": None,
     },
-}
+})
 
 # Mythic+ Sensors
-MYTHICPLUS_SENSOR_TYPES = {
+MYTHICPLUS_SENSOR_TYPES = MappingProxyType({
     "mythicplus_score": {
         "name": "M+ Score",
         "icon": "mdi:diamond-stone",
@@ -198,19 +207,19 @@ MYTHICPLUS_SENSOR_TYPES = {
         "unit": "level",
         "device_class": None,
     },
-}
+})
 
 # Combine all sensor types
-ALL_SENSOR_TYPES = {
+ALL_SENSOR_TYPES = MappingProxyType({
     **BASIC_SENSOR_TYPES,
     **SERVER_SENSOR_TYPES,
     **PVP_SENSOR_TYPES,
     **RAID_SENSOR_TYPES,
     **MYTHICPLUS_SENSOR_TYPES,
-}
+})
 
 # Current raid tiers (update when new raids release)
-CURRENT_RAIDS = {
+CURRENT_RAIDS = MappingProxyType({
     "aberrus-the-shadowed-crucible": {
         "name": "Aberrus, the Shadowed Crucible",
         "total_bosses": 9,
@@ -226,17 +235,17 @@ CURRENT_RAIDS = {
         "total_bosses": 8,
         "expansion": "dragonflight",
     },
-}
+})
 
 # PvP Bracket mappings
-PVP_BRACKETS = {
+PVP_BRACKETS = MappingProxyType({
     "ARENA_2v2": "2v2",
     "ARENA_3v3": "3v3", 
     "BATTLEGROUNDS": "rbg",
-}
+})
 
 # Mythic+ dungeons for current season
-CURRENT_MYTHICPLUS_DUNGEONS = [
+CURRENT_MYTHICPLUS_DUNGEONS = (
     "temple-of-the-jade-serpent",
     "brackenhide-hollow",
     "halls-of-infusion", 
@@ -245,20 +254,20 @@ CURRENT_MYTHICPLUS_DUNGEONS = [
     "freehold",
     "underrot",
     "everbloom",
-]
+)
 
 # Difficulty mappings
-DIFFICULTY_MAPPING = {
+DIFFICULTY_MAPPING = MappingProxyType({
     1: "Normal",
     2: "Heroic", 
     3: "Raid Finder",
     4: "Mythic",
     5: "Normal (Dungeon)",
     23: "Mythic (Dungeon)",
-}
+})
 
 # Item quality colors for UI
-ITEM_QUALITY_COLORS = {
+ITEM_QUALITY_COLORS = MappingProxyType({
     0: "#9D9D9D",  # Poor (Gray)
     1: "#FFFFFF",  # Common (White)
     2: "#1EFF00",  # Uncommon (Green)
@@ -267,10 +276,10 @@ ITEM_QUALITY_COLORS = {
     5: "#FF8000",  # Legendary (Orange)
     6: "#E6CC80",  # Artifact (Light Orange)
     7: "#00CCFF",  # Heirloom (Light Blue)
-}
+})
 
 # Class colors for UI
-CLASS_COLORS = {
+CLASS_COLORS = MappingProxyType({
     "Death Knight": "#C41F3B",
     "Demon Hunter": "#A330C9", 
     "Druid": "#FF7D0A",
@@ -284,11 +293,39 @@ CLASS_COLORS = {
     "Shaman": "#0070DE",
     "Warlock": "#9482C9",
     "Warrior": "#C79C6E",
-}
+})
 
 # API Rate limits
-API_RATE_LIMIT_PER_SECOND = 36000
+API_RATE_LIMIT_PER_SECOND = 100
 API_RATE_LIMIT_PER_HOUR = 36000
+API_RATE_LIMIT_HEADROOM = 0.9  # Fraction of the quota the client paces itself to
+API_CONCURRENCY_LIMIT = 10  # Requests in flight at once per client
+API_CONNECTIONS_PER_HOST = 8  # Pooled keep-alive connections per Blizzard host
+
+# Retry/backoff for throttled (429) and transient 5xx responses
+API_MAX_RETRIES = 3
+API_BACKOFF_BASE = 1.0  # seconds
+API_BACKOFF_CAP = 30  # seconds
+API_BACKOFF_JITTER = 0.5  # up to +50% random spread
+
+# Client-side response cache lifetimes (seconds)
+STATIC_DATA_CACHE_TTL = 86400  # static-* namespace
+REALM_DATA_CACHE_TTL = 86400  # realm index and realm info (timezone, locale)
+PROFILE_CACHE_TTL = 900  # character profile, equipment and achievements
+CACHE_STALE_FACTOR = 2  # serve entries up to this many TTLs old while refreshing
+SEASON_ID_CACHE_TTL = 3600  # derived current Mythic+ season id
+
+# OAuth token persistence
+TOKEN_STORE_VERSION = 1
+TOKEN_REFRESH_MARGIN = 300  # Refresh tokens 5 minutes before they expire
+TOKEN_BACKGROUND_REFRESH_LEAD = 60  # Refresh in the background this long before that
+
+# Skip an endpoint for a while after this many consecutive failures
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_COOLDOWN = 60  # seconds
 
 # Error codes that should trigger re-authentication
-AUTH_ERROR_CODES = [401, 403]
\ No newline at end of file
+AUTH_ERROR_CODES = frozenset({401, 403})
+
+# Transient error codes that are worth retrying
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
@@ -1,7 +1,10 @@
 """Support for WoW Blizzard API sensors with all features."""
 import asyncio
 import logging
+import aiohttp
+from dataclasses import dataclass
 from datetime import timedelta
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
 from homeassistant.components.sensor import (
@@ -13,6 +16,7 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -38,154 +42,249 @@ from .const import (
     MYTHICPLUS_SENSOR_TYPES,
     DEFAULT_SCAN_INTERVAL,
     FAST_SCAN_INTERVAL,
+    REFRESH_COOLDOWN,
+    UPDATE_FETCH_TIMEOUT,
     SLOW_SCAN_INTERVAL,
     PVP_BRACKETS,
     CURRENT_RAIDS,
     CLASS_COLORS,
 )
-from .api_client import WoWBlizzardAPIClient
+from . import get_shared_client
+from .api_client import WoWAPIError, WoWBlizzardAPIClient, WoWNotFound
 
 _LOGGER = logging.getLogger(__name__)
 
+# Update tiers: ratings and realm status move fast, raid progress and realm
+# details hardly at all
+TIER_FAST = "fast"
+TIER_DEFAULT = "default"
+TIER_SLOW = "slow"
+
+TIER_INTERVALS = {
+    TIER_FAST: FAST_SCAN_INTERVAL,
+    TIER_DEFAULT: DEFAULT_SCAN_INTERVAL,
+    TIER_SLOW: SLOW_SCAN_INTERVAL,
+}
+
+SENSOR_TIERS = {
+    **dict.fromkeys(BASIC_SENSOR_TYPES, TIER_DEFAULT),
+    **dict.fromkeys(SERVER_SENSOR_TYPES, TIER_FAST),
+    **dict.fromkeys(PVP_SENSOR_TYPES, TIER_FAST),
+    **dict.fromkeys(RAID_SENSOR_TYPES, TIER_SLOW),
+    **dict.fromkeys(MYTHICPLUS_SENSOR_TYPES, TIER_DEFAULT),
+}
+
+SENSOR_CATEGORIES = {
+    **dict.fromkeys(BASIC_SENSOR_TYPES, "character"),
+    **dict.fromkeys(PVP_SENSOR_TYPES, "pvp"),
+    **dict.fromkeys(RAID_SENSOR_TYPES, "raid"),
+    **dict.fromkeys(MYTHICPLUS_SENSOR_TYPES, "mythic_plus"),
+}
+
+# Raid difficulty type -> progress sensor it counts towards
+RAID_DIFFICULTY_SENSORS = {
+    "LFR": "raid_progress_lfr",
+    "NORMAL": "raid_progress_normal",
+    "HEROIC": "raid_progress_heroic",
+    "MYTHIC": "raid_progress_mythic",
+}
+
+
+@dataclass(slots=True)
+class CharacterData:
+    """One character's values for one update tier.
+
+    Fields are named after the sensor types reading them. A field stays None
+    when its tier does not poll it or its data group came back empty or
+    failed, so the sensor shows unknown rather than a misleading zero.
+    """
+
+    # Basic data
+    character_level: Optional[int] = None
+    character_item_level: Optional[float] = None
+    guild_name: Optional[str] = None
+    achievement_points: Optional[int] = None
+    character_money: Optional[int] = None
+    last_login_timestamp: Optional[int] = None
+    character_class: Optional[str] = None
+    character_race: Optional[str] = None
+    realm: Optional[str] = None
+    faction: Optional[str] = None
+    gender: Optional[str] = None
+    spec: Optional[str] = None
+    # PvP
+    pvp_2v2_rating: Optional[int] = None
+    pvp_3v3_rating: Optional[int] = None
+    pvp_rbg_rating: Optional[int] = None
+    pvp_honor_level: Optional[int] = None
+    pvp_wins_season: Optional[int] = None
+    # Raids
+    raid_progress_lfr: Optional[int] = None
+    raid_progress_normal: Optional[int] = None
+    raid_progress_heroic: Optional[int] = None
+    raid_progress_mythic: Optional[int] = None
+    raid_kills_total: Optional[int] = None
+    # Mythic+
+    mythicplus_score: Optional[float] = None
+    mythicplus_best_run: Optional[int] = None
+    mythicplus_runs_completed: Optional[int] = None
+    mythicplus_runs_timed: Optional[int] = None
+    mythicplus_weekly_best: Optional[int] = None
+
 
 class WoWDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching all WoW data from the API."""
+    """Class to manage fetching one update tier of WoW data from the API."""
 
     def __init__(
         self, 
         hass: HomeAssistant, 
         client: WoWBlizzardAPIClient,
         characters: List[Dict[str, str]],
-        features: Dict[str, bool]
+        features: Dict[str, bool],
+        tier: str = TIER_DEFAULT,
     ):
         """Initialize."""
         self.client = client
         self.characters = characters
         self.features = features
+        self.tier = tier
         self.realms = set(char["realm"] for char in characters)
+        self._updating = False
+
+        self._character_fetchers = {
+            TIER_FAST: (self._fetch_pvp_data,),
+            TIER_DEFAULT: (self._fetch_basic_character_data, self._fetch_mythicplus_data),
+            TIER_SLOW: (self._fetch_raid_data,),
+        }[tier]
+        self._server_fetcher = {
+            TIER_FAST: self._fetch_realm_status,
+            TIER_SLOW: self._fetch_realm_details,
+        }.get(tier)
 
         super().__init__(
             hass,
             _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            name=f"{DOMAIN}_{tier}",
+            update_interval=timedelta(seconds=TIER_INTERVALS[tier]),
+            # Most polls return the same values; skip the state writes then
+            always_update=False,
+            # Coalesce bursts of refresh requests into one API sweep
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REFRESH_COOLDOWN, immediate=False
+            ),
         )
 
     async def _fetch_basic_character_data(self, realm: str, character_name: str) -> Dict[str, Any]:
         """Fetch basic character data."""
-        try:
-            profile = await self.client.get_character_profile(realm, character_name)
-            equipment = await self.client.get_character_equipment(realm, character_name)
-            achievements = await self.client.get_character_achievements(realm, character_name)
-            # Item level from character profile response
-            item_level = profile.get("equipped_item_level", 0)
-
-            # Get achievement points
-            achievement_points = achievements.get("total_points", 0)
-
-            # Get guild information
-            guild_name = None
-            if profile.get("guild"):
-                guild_name = profile["guild"]["name"]
-
-            return {
-                "character_level": profile.get("level", 0),
-                "character_item_level": item_level,
-                "guild_name": guild_name,
-                "achievement_points": achievement_points,
-                "last_login_timestamp": profile.get("last_login_timestamp"),
-                "character_class": profile.get("character_class", {}).get("name"),
-                "character_race": profile.get("race", {}).get("name"),
-                "realm": profile.get("realm", {}).get("name"),
-                "faction": profile.get("faction", {}).get("name"),
-                "gender": profile.get("gender", {}).get("name"),
-                "spec": profile.get("active_spec", {}).get("name"),
-            }
-
-        except Exception as err:
-            _LOGGER.error(f"Error fetching basic data for {character_name}-{realm}: {err}")
+        profile, equipment, achievements = await asyncio.gather(
+            self.client.get_character_profile(realm, character_name, raise_for_status=True),
+            self.client.get_character_equipment(realm, character_name, raise_for_status=True),
+            self.client.get_character_achievements(realm, character_name, raise_for_status=True),
+            return_exceptions=True,
+        )
+        # Without the profile there is nothing to report; the other two
+        # only fill in optional values
+        if isinstance(profile, Exception):
+            raise profile
+        if not profile:
+            # Leave the basic fields unknown instead of reporting level 0
             return {}
+        if isinstance(equipment, Exception):
+            _LOGGER.debug("No equipment for %s-%s: %s", character_name, realm, equipment)
+            equipment = {}
+        if isinstance(achievements, Exception):
+            _LOGGER.debug("No achievements for %s-%s: %s", character_name, realm, achievements)
+            achievements = {}
+        # Item level from character profile response, falling back to the
+        # equipped items when the profile does not carry it
+        item_level = profile.get("equipped_item_level") or self.client.calculate_item_level(equipment)
+
+        # Get achievement points
+        achievement_points = achievements.get("total_points", 0)
+
+        # Get guild information
+        guild_name = None
+        if profile.get("guild"):
+            guild_name = profile["guild"]["name"]
 
-    async def _fetch_server_data(self, realm: str) -> Dict[str, Any]:
-        """Fetch server status data."""
+        return {
+            "character_level": profile.get("level", 0),
+            "character_item_level": item_level,
+            "guild_name": guild_name,
+            "achievement_points": achievement_points,
+            "last_login_timestamp": profile.get("last_login_timestamp"),
+            "character_class": profile.get("character_class", {}).get("name"),
+            "character_race": profile.get("race", {}).get("name"),
+            "realm": profile.get("realm", {}).get("name"),
+            "faction": profile.get("faction", {}).get("name"),
+            "gender": profile.get("gender", {}).get("name"),
+            "spec": profile.get("active_spec", {}).get("name"),
+        }
+
+    async def _fetch_realm_details(self, realm: str) -> Dict[str, Any]:
+        """Fetch the realm details that practically never change."""
         if not self.features.get(CONF_ENABLE_SERVER_STATUS, False):
             return {}
 
-        try:
-            realm_info = await self.client.get_realm_info(realm)
-            connected_realm = await self.client.get_connected_realm(realm)
-
-            status = "Unknown"
-            population = "Unknown"
-            queue_time = 0
-
-            if connected_realm:
-                status = connected_realm.get("status", {}).get("name", "Unknown")
-                population = connected_realm.get("population", {}).get("name", "Unknown")
-                # Get queue information if available
-                if connected_realm.get("has_queue"):
-                    queue_time = connected_realm.get("queue_time", 0)
-
-            return {
-                "realm_status": status,
-                "realm_population": population,
-                "realm_queue": queue_time,
-                "realm_timezone": realm_info.get("timezone", "Unknown"),
-                "realm_locale": realm_info.get("locale", "Unknown"),
-            }
-
-        except Exception as err:
-            _LOGGER.error(f"Error fetching server data for {realm}: {err}")
+        realm_info = await self.client.get_realm_info(realm, raise_for_status=True)
+        return {
+            "realm_timezone": realm_info.get("timezone", "Unknown"),
+            "realm_locale": realm_info.get("locale", "Unknown"),
+        }
+
+    async def _fetch_realm_status(self, realm: str) -> Dict[str, Any]:
+        """Fetch server status data."""
+        if not self.features.get(CONF_ENABLE_SERVER_STATUS, False):
             return {}
 
+        connected_realm = await self.client.get_connected_realm(realm, raise_for_status=True)
+
+        status = "Unknown"
+        population = "Unknown"
+        queue_time = 0
+
+        if connected_realm:
+            status = connected_realm.get("status", {}).get("name", "Unknown")
+            population = connected_realm.get("population", {}).get("name", "Unknown")
+            # Get queue information if available
+            if connected_realm.get("has_queue"):
+                queue_time = connected_realm.get("queue_time", 0)
+
+        return {
+            "realm_status": status,
+            "realm_population": population,
+            "realm_queue": queue_time,
+        }
+
     async def _fetch_pvp_data(self, realm: str, character_name: str) -> Dict[str, Any]:
         """Fetch PvP data for a character."""
         if not self.features.get(CONF_ENABLE_PVP, False):
             return {}
 
-        try:
-            pvp_data = await self.client.get_all_pvp_data(realm, character_name)
-
-            # Extract ratings and stats
-            ratings_2v2 = 0
-            ratings_3v3 = 0
-            ratings_rbg = 0
-            honor_level = 0
-            wins_season = 0
-
-            if pvp_data.get("summary"):
-                honor_level = pvp_data["summary"].get("honor_level", 0)
-
-            # Process bracket data
-            for bracket, data in pvp_data.items():
-                if bracket == "summary":
-                    continue
-                    
-                if not data or "rating" not in data:
-                    continue
-
-                rating = data["rating"]
-                season_wins = data.get("season_match_statistics", {}).get("won", 0)
-                wins_season += season_wins
-
-                if bracket == "2v2":
-                    ratings_2v2 = rating
-                elif bracket == "3v3":
-                    ratings_3v3 = rating
-                elif bracket == "rbg":
-                    ratings_rbg = rating
-
-            return {
-                "pvp_2v2_rating": ratings_2v2,
-                "pvp_3v3_rating": ratings_3v3,
-                "pvp_rbg_rating": ratings_rbg,
-                "pvp_honor_level": honor_level,
-                "pvp_wins_season": wins_season,
-            }
-
-        except Exception as err:
-            _LOGGER.error(f"Error fetching PvP data for {character_name}-{realm}: {err}")
-            return {}
+        pvp_data = await self.client.get_all_pvp_data(realm, character_name, raise_for_status=True)
+
+        honor_level = 0
+        if pvp_data.get("summary"):
+            honor_level = pvp_data["summary"].get("honor_level", 0)
+
+        # Rated brackets only; unrated ones come back empty or without a rating
+        brackets = {
+            bracket: data
+            for bracket, data in pvp_data.items()
+            if bracket != "summary" and data and "rating" in data
+        }
+        wins_season = sum(
+            data.get("season_match_statistics", {}).get("won", 0)
+            for data in brackets.values()
+        )
+
+        return {
+            "pvp_2v2_rating": brackets.get("2v2", {}).get("rating", 0),
+            "pvp_3v3_rating": brackets.get("3v3", {}).get("rating", 0),
+            "pvp_rbg_rating": brackets.get("rbg", {}).get("rating", 0),
+            "pvp_honor_level": honor_level,
+            "pvp_wins_season": wins_season,
+        }
 
     async def _fetch_raid_data(self, realm: str, character_name: str) -> Dict[str, Any]:
         """Fetch raid progress data."""
@@ -193,46 +292,30 @@ class WoWDataUpdateCoordinator(DataUpdateCoordinator):
             return {}
 
         try:
-            encounters = await self.client.get_character_encounters_raids(realm, character_name)
-
-            progress_lfr = 0
-            progress_normal = 0
-            progress_heroic = 0
-            progress_mythic = 0
-            total_kills = 0
-
-            # Count all boss kills from all expansions
-            if encounters and "expansions" in encounters:
-                for expansion in encounters["expansions"]:
-                    for instance in expansion.get("instances", []):
-                        for mode in instance.get("modes", []):
-                            difficulty = mode.get("difficulty", {}).get("name", "")
-                            progress = mode.get("progress", {})
-                            completed = progress.get("completed_count", 0)
-                            total_encounters = progress.get("total_count", 0)
-
-                            if "raid finder" in difficulty.lower():
-                                progress_lfr += completed
-                            elif "normal" in difficulty.lower():
-                                progress_normal += completed
-                            elif "heroic" in difficulty.lower():
-                                progress_heroic += completed
-                            elif "mythic" in difficulty.lower():
-                                progress_mythic += completed
-
-                            total_kills += completed
-
-            return {
-                "raid_progress_lfr": progress_lfr,
-                "raid_progress_normal": progress_normal,
-                "raid_progress_heroic": progress_heroic,
-                "raid_progress_mythic": progress_mythic,
-                "raid_kills_total": total_kills,
-            }
-
-        except Exception as err:
-            _LOGGER.error(f"Error fetching raid data for {character_name}-{realm}: {err}")
-            return {}
+            encounters = await self.client.get_character_encounters_raids(
+                realm, character_name, raise_for_status=True
+            )
+        except WoWNotFound:
+            # No raid history yet
+            encounters = {}
+
+        totals = dict.fromkeys(RAID_DIFFICULTY_SENSORS.values(), 0)
+        total_kills = 0
+
+        # Count all boss kills from all expansions
+        for expansion in (encounters or {}).get("expansions", ()):
+            for instance in expansion.get("instances", ()):
+                for mode in instance.get("modes", ()):
+                    completed = mode.get("progress", {}).get("completed_count", 0)
+                    # The difficulty type is locale-independent, unlike its name
+                    sensor_key = RAID_DIFFICULTY_SENSORS.get(
+                        mode.get("difficulty", {}).get("type")
+                    )
+                    if sensor_key:
+                        totals[sensor_key] += completed
+                    total_kills += completed
+
+        return {**totals, "raid_kills_total": total_kills}
 
     async def _fetch_mythicplus_data(self, realm: str, character_name: str) -> Dict[str, Any]:
         """Fetch Mythic+ data."""
@@ -240,98 +323,150 @@ class WoWDataUpdateCoordinator(DataUpdateCoordinator):
             return {}
 
         try:
-            profile = await self.client.get_character_mythicplus_profile(realm, character_name)
-            season_data = await self.client.get_character_mythicplus_season(realm, character_name)
-
-            score = 0
-            best_run = 0
-            runs_completed = 0
-            runs_timed = 0
-            weekly_best = 0
-
-            # Get current season data
-            if season_data:
-                best_runs = season_data.get("best_runs", [])
-                all_runs = []
-                # Collect all runs from all dungeons
-                for run in best_runs:
-                    if "members" in run:
-                        all_runs.append(run)
-                # If the API provides additional fields for all runs, add here
-                if best_runs:
-                    best_run = max(run.get("keystone_level", 0) for run in best_runs)
-                # Total number of all runs and timed runs
-                runs_completed = len(all_runs)
-                runs_timed = sum(1 for run in all_runs if run.get("is_completed_within_time", False))
-
-                # Use Blizzard score directly
-                score = season_data.get("mythic_rating", {}).get("rating", 0)
-
-            # Get weekly data if available
-            if profile and "current_period" in profile:
-                current_period = profile["current_period"]
-                if "best_runs" in current_period:
-                    weekly_runs = current_period["best_runs"]
-                    if weekly_runs:
-                        weekly_best = max(run.get("keystone_level", 0) for run in weekly_runs)
-
-            return {
-                "mythicplus_score": score,
-                "mythicplus_best_run": best_run,
-                "mythicplus_runs_completed": runs_completed,
-                "mythicplus_runs_timed": runs_timed,
-                "mythicplus_weekly_best": weekly_best,
-            }
-
-        except Exception as err:
-            _LOGGER.error(f"Error fetching M+ data for {character_name}-{realm}: {err}")
-            return {}
+            profile, season_data = await self.client.get_character_mythicplus_all(
+                realm, character_name, raise_for_status=True
+            )
+        except WoWNotFound:
+            # Never ran a keystone
+            profile, season_data = {}, {}
+
+        score = 0
+        best_run = 0
+        runs_completed = 0
+        runs_timed = 0
+        weekly_best = 0
+
+        # Get current season data
+        if season_data:
+            # One pass over the best runs: highest key, plus how many runs
+            # (those with a group listed) there were and how many were timed
+            for run in season_data.get("best_runs", ()):
+                keystone_level = run.get("keystone_level", 0)
+                if keystone_level > best_run:
+                    best_run = keystone_level
+                if "members" in run:
+                    runs_completed += 1
+                    if run.get("is_completed_within_time", False):
+                        runs_timed += 1
+
+            # Use Blizzard score directly
+            score = season_data.get("mythic_rating", {}).get("rating", 0)
+
+        # Get weekly data if available
+        if profile and "current_period" in profile:
+            current_period = profile["current_period"]
+            if "best_runs" in current_period:
+                weekly_runs = current_period["best_runs"]
+                if weekly_runs:
+                    weekly_best = max(run.get("keystone_level", 0) for run in weekly_runs)
+
+        return {
+            "mythicplus_score": score,
+            "mythicplus_best_run": best_run,
+            "mythicplus_runs_completed": runs_completed,
+            "mythicplus_runs_timed": runs_timed,
+            "mythicplus_weekly_best": weekly_best,
+        }
+
+    async def _fetch_character_data(self, realm: str, character_name: str) -> CharacterData:
+        """Fetch this tier's data groups for one character concurrently.
+
+        A failed group leaves its fields unknown; only when every group fails
+        is the character reported as failed.
+        """
+        groups = await asyncio.gather(
+            *(
+                asyncio.wait_for(fetch(realm, character_name), UPDATE_FETCH_TIMEOUT)
+                for fetch in self._character_fetchers
+            ),
+            return_exceptions=True,
+        )
+
+        # Combine all character data
+        character_data: Dict[str, Any] = {}
+        errors = []
+        for group in groups:
+            if isinstance(group, BaseException):
+                errors.append(group)
+            else:
+                character_data.update(group)
+        if errors and len(errors) == len(groups):
+            raise errors[0]
+        for err in errors:
+            _log_fetch_error(f"{character_name}-{realm}", err)
+        return CharacterData(**character_data)
 
     async def _async_update_data(self):
         """Update data via library."""
+        # A sweep stuck behind rate limiting must not have another one
+        # stacked on top of it; keep the current data until it finishes
+        if self._updating:
+            _LOGGER.debug("%s update still running, skipping this one", self.name)
+            return self.data
+        self._updating = True
         try:
-            all_data = {}
-            
-            # Fetch data for each character
-            for character in self.characters:
-                realm = character["realm"]
-                name = character["character_name"]
-                char_key = f"{realm}-{name}"
-                
-                # Fetch all character data
-                basic_data = await self._fetch_basic_character_data(realm, name)
-                pvp_data = await self._fetch_pvp_data(realm, name)
-                raid_data = await self._fetch_raid_data(realm, name)
-                mythicplus_data = await self._fetch_mythicplus_data(realm, name)
-                
-                # Combine all character data
-                character_data = {
-                    **basic_data,
-                    **pvp_data,
-                    **raid_data,
-                    **mythicplus_data,
-                }
-                
-                all_data[char_key] = character_data
-                
-                # Small delay to avoid rate limiting
-                await asyncio.sleep(0.1)
-
-            # Fetch server data for each unique realm
-            server_data = {}
-            for realm in self.realms:
-                realm_data = await self._fetch_server_data(realm)
-                server_data[realm] = realm_data
-                await asyncio.sleep(0.1)
-
-            # Combine character and server data
-            all_data["servers"] = server_data
-            all_data["last_update"] = self.last_update_success
-
-            return all_data
-
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with API: {err}")
+            return await self._async_fetch_all()
+        finally:
+            self._updating = False
+
+    async def _async_fetch_all(self) -> Dict[str, Any]:
+        """Fetch this tier's data for every character and realm."""
+        realms = list(self.realms) if self._server_fetcher else []
+        targets = [
+            f"{character['realm']}-{character['character_name']}"
+            for character in self.characters
+        ]
+
+        # Characters and realms are independent; the API client enforces
+        # the rate limit and concurrency cap for all of them
+        results = await asyncio.gather(
+            *(
+                self._fetch_character_data(character["realm"], character["character_name"])
+                for character in self.characters
+            ),
+            *(
+                asyncio.wait_for(self._server_fetcher(realm), UPDATE_FETCH_TIMEOUT)
+                for realm in realms
+            ),
+            return_exceptions=True,
+        )
+
+        failures = [
+            (target, result)
+            for target, result in zip(targets + realms, results)
+            if isinstance(result, BaseException)
+        ]
+        if len(failures) == len(results):
+            raise UpdateFailed(f"Error communicating with API: {failures[0][1]}")
+        for target, err in failures:
+            _log_fetch_error(target, err)
+
+        character_results = results[:len(targets)]
+        all_data = {
+            char_key: character_data
+            for char_key, character_data in zip(targets, character_results)
+            if not isinstance(character_data, BaseException)
+        }
+
+        # Combine character and server data
+        all_data["servers"] = {
+            realm: realm_data
+            for realm, realm_data in zip(realms, results[len(targets):])
+            if not isinstance(realm_data, BaseException)
+        }
+        all_data["last_update"] = self.last_update_success
+
+        return all_data
+
+
+def _log_fetch_error(target: str, err: BaseException) -> None:
+    """Log a failed fetch, with a traceback only when the failure is unexpected."""
+    if isinstance(err, asyncio.TimeoutError):
+        _LOGGER.warning("Timed out fetching data for %s", target)
+    elif isinstance(err, (WoWAPIError, aiohttp.ClientError)):
+        _LOGGER.debug("Error fetching data for %s: %s", target, err)
+    else:
+        _LOGGER.error("Unexpected error fetching data for %s", target, exc_info=err)
 
 
 async def async_setup_entry(
@@ -355,73 +490,98 @@ async def async_setup_entry(
         _LOGGER.error("No characters configured")
         return
 
-    client = WoWBlizzardAPIClient(client_id, client_secret, region)
-    coordinator = WoWDataUpdateCoordinator(hass, client, characters, features)
+    client = get_shared_client(hass, region, client_id, client_secret, entry.entry_id)
+
+    # Only poll the tiers that have something to update
+    tiers = [TIER_DEFAULT]
+    if features[CONF_ENABLE_PVP] or features[CONF_ENABLE_SERVER_STATUS]:
+        tiers.append(TIER_FAST)
+    if features[CONF_ENABLE_RAIDS] or features[CONF_ENABLE_SERVER_STATUS]:
+        tiers.append(TIER_SLOW)
+    coordinators = {
+        tier: WoWDataUpdateCoordinator(hass, client, characters, features, tier)
+        for tier in tiers
+    }
 
     # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
-
-    # Create sensors
-    entities = []
-    
-    # Character sensors
-    for character in characters:
-        realm = character["realm"]
-        name = character["character_name"]
-        char_key = f"{realm}-{name}"
-        
-        # Basic character sensors (always enabled)
-        for sensor_type in BASIC_SENSOR_TYPES:
-            entities.append(
-                WoWCharacterSensor(coordinator, sensor_type, char_key, name, realm)
-            )
-        
-        # PvP sensors
-        if features[CONF_ENABLE_PVP]:
-            for sensor_type in PVP_SENSOR_TYPES:
-                entities.append(
-                    WoWCharacterSensor(coordinator, sensor_type, char_key, name, realm)
-                )
-        
-        # Raid sensors
-        if features[CONF_ENABLE_RAIDS]:
-            for sensor_type in RAID_SENSOR_TYPES:
-                entities.append(
-                    WoWCharacterSensor(coordinator, sensor_type, char_key, name, realm)
-                )
-        
-        # Mythic+ sensors
-        if features[CONF_ENABLE_MYTHIC_PLUS]:
-            for sensor_type in MYTHICPLUS_SENSOR_TYPES:
-                entities.append(
-                    WoWCharacterSensor(coordinator, sensor_type, char_key, name, realm)
-                )
+    await asyncio.gather(
+        *(
+            coordinator.async_config_entry_first_refresh()
+            for coordinator in coordinators.values()
+        )
+    )
+
+    # Create sensors: basic character sensors are always enabled
+    character_sensor_types = [
+        *BASIC_SENSOR_TYPES,
+        *(PVP_SENSOR_TYPES if features[CONF_ENABLE_PVP] else ()),
+        *(RAID_SENSOR_TYPES if features[CONF_ENABLE_RAIDS] else ()),
+        *(MYTHICPLUS_SENSOR_TYPES if features[CONF_ENABLE_MYTHIC_PLUS] else ()),
+    ]
+    entities = [
+        WoWCharacterSensor(
+            coordinators,
+            sensor_type,
+            f"{character['realm']}-{character['character_name']}",
+            character["character_name"],
+            character["realm"],
+        )
+        for character in characters
+        for sensor_type in character_sensor_types
+    ]
 
     # Server sensors
     if features[CONF_ENABLE_SERVER_STATUS]:
-        realms = set(char["realm"] for char in characters)
-        for realm in realms:
-            for sensor_type in SERVER_SENSOR_TYPES:
-                entities.append(
-                    WoWServerSensor(coordinator, sensor_type, realm)
-                )
+        entities.extend(
+            WoWServerSensor(coordinators, sensor_type, realm)
+            for realm in {char["realm"] for char in characters}
+            for sensor_type in SERVER_SENSOR_TYPES
+        )
 
     async_add_entities(entities)
 
 
+# Device info is the same for every sensor of a character or realm, so they
+# share one dict
+@lru_cache(maxsize=None)
+def _character_device_info(realm: str, character_name: str) -> Dict[str, Any]:
+    """Return the device info shared by a character's sensors."""
+    return {
+        "identifiers": {(DOMAIN, f"{realm}_{character_name}")},
+        "name": f"{character_name} ({realm})",
+        "manufacturer": "Blizzard Entertainment",
+        "model": "World of Warcraft Character",
+        "sw_version": "The War Within",
+    }
+
+
+@lru_cache(maxsize=None)
+def _server_device_info(realm: str) -> Dict[str, Any]:
+    """Return the device info shared by a realm's sensors."""
+    return {
+        "identifiers": {(DOMAIN, f"server_{realm}")},
+        "name": f"{realm.title()} Server",
+        "manufacturer": "Blizzard Entertainment",
+        "model": "World of Warcraft Realm",
+        "sw_version": "The War Within",
+    }
+
+
 class WoWCharacterSensor(CoordinatorEntity, SensorEntity):
     """Representation of a WoW character sensor."""
 
     def __init__(
         self, 
-        coordinator: WoWDataUpdateCoordinator,
+        coordinators: Dict[str, WoWDataUpdateCoordinator],
         sensor_type: str,
         char_key: str,
         character_name: str,
         realm: str
     ):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
+        """Initialize the sensor on the coordinator of its update tier."""
+        super().__init__(coordinators[SENSOR_TIERS[sensor_type]])
+        # Class, race and the like come with the basic data
+        self._profile_coordinator = coordinators[TIER_DEFAULT]
         self._sensor_type = sensor_type
         self._char_key = char_key
         self._character_name = character_name
@@ -434,59 +594,51 @@ class WoWCharacterSensor(CoordinatorEntity, SensorEntity):
         self._attr_icon = sensor_config["icon"]
         self._attr_native_unit_of_measurement = sensor_config.get("unit")
         self._attr_device_class = sensor_config.get("device_class")
+        self._category = SENSOR_CATEGORIES[sensor_type]
+        self._attr_device_info = _character_device_info(realm, character_name)
+
+    async def async_added_to_hass(self) -> None:
+        """Also update when the basic data behind the attributes changes."""
+        await super().async_added_to_hass()
+        if self._profile_coordinator is not self.coordinator:
+            self.async_on_remove(
+                self._profile_coordinator.async_add_listener(self.async_write_ha_state)
+            )
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
         if not self.coordinator.data or self._char_key not in self.coordinator.data:
             return None
-        return self.coordinator.data[self._char_key].get(self._sensor_type)
+        return getattr(self.coordinator.data[self._char_key], self._sensor_type)
 
     @property
     def extra_state_attributes(self):
         """Return additional state attributes."""
-        if not self.coordinator.data or self._char_key not in self.coordinator.data:
+        profile_data = self._profile_coordinator.data
+        if not profile_data or self._char_key not in profile_data:
             return {}
         
-        char_data = self.coordinator.data[self._char_key]
+        char_data = profile_data[self._char_key]
         
         attributes = {
             "character_name": self._character_name,
             "realm": self._realm,
-            "character_class": char_data.get("character_class"),
-            "character_race": char_data.get("character_race"),
-            "character_level": char_data.get("character_level"),
+            "character_class": char_data.character_class,
+            "character_race": char_data.character_race,
+            "character_level": char_data.character_level,
             "last_update": self.coordinator.last_update_success,
-            "faction": char_data.get("faction"),
-            "active_spec": char_data.get("spec"),
+            "faction": char_data.faction,
+            "active_spec": char_data.spec,
+            "category": self._category,
         }
         
         # Add class color if available
-        if char_data.get("character_class") in CLASS_COLORS:
-            attributes["class_color"] = CLASS_COLORS[char_data["character_class"]]
-        
-        # Add specific attributes based on sensor type
-        if self._sensor_type in PVP_SENSOR_TYPES:
-            attributes["category"] = "pvp"
-        elif self._sensor_type in RAID_SENSOR_TYPES:
-            attributes["category"] = "raid"
-        elif self._sensor_type in MYTHICPLUS_SENSOR_TYPES:
-            attributes["category"] = "mythic_plus"
-        else:
-            attributes["category"] = "character"
-            
-        return attributes
+        class_color = CLASS_COLORS.get(char_data.character_class)
+        if class_color is not None:
+            attributes["class_color"] = class_color
 
-    @property
-    def device_info(self):
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, f"{self._realm}_{self._character_name}")},
-            "name": f"{self._character_name} ({self._realm})",
-            "manufacturer": "Blizzard Entertainment",
-            "model": "World of Warcraft Character",
-            "sw_version": "The War Within",
-        }
+        return attributes
 
 
 class WoWServerSensor(CoordinatorEntity, SensorEntity):
@@ -494,12 +646,14 @@ class WoWServerSensor(CoordinatorEntity, SensorEntity):
 
     def __init__(
         self, 
-        coordinator: WoWDataUpdateCoordinator,
+        coordinators: Dict[str, WoWDataUpdateCoordinator],
         sensor_type: str,
         realm: str
     ):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
+        """Initialize the sensor on the coordinator of its update tier."""
+        super().__init__(coordinators[SENSOR_TIERS[sensor_type]])
+        # Timezone and locale are polled on the slow tier
+        self._details_coordinator = coordinators[TIER_SLOW]
         self._sensor_type = sensor_type
         self._realm = realm
         
@@ -510,6 +664,14 @@ class WoWServerSensor(CoordinatorEntity, SensorEntity):
         self._attr_icon = sensor_config["icon"]
         self._attr_native_unit_of_measurement = sensor_config.get("unit")
         self._attr_device_class = sensor_config.get("device_class")
+        self._attr_device_info = _server_device_info(realm)
+
+    async def async_added_to_hass(self) -> None:
+        """Also update when the realm details behind the attributes change."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._details_coordinator.async_add_listener(self.async_write_ha_state)
+        )
 
     @property
     def native_value(self):
@@ -528,23 +690,12 @@ class WoWServerSensor(CoordinatorEntity, SensorEntity):
             or self._realm not in self.coordinator.data["servers"]):
             return {}
         
-        realm_data = self.coordinator.data["servers"][self._realm]
+        details = (self._details_coordinator.data or {}).get("servers", {}).get(self._realm, {})
         
         return {
             "realm": self._realm,
             "category": "server",
-            "timezone": realm_data.get("realm_timezone"),
-            "locale": realm_data.get("realm_locale"),
+            "timezone": details.get("realm_timezone"),
+            "locale": details.get("realm_locale"),
             "last_update": self.coordinator.last_update_success,
-        }
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, f"server_{self._realm}")},
-            "name": f"{self._realm.title()} Server",
-            "manufacturer": "Blizzard Entertainment",
-            "model": "World of Warcraft Realm",
-            "sw_version": "The War Within",
         }
\ No newline at end of file